@@ -325,7 +325,7 @@ async def list_projects(
     bus = event_bus or EventBus()
     try:
         registry = ProjectRegistry.load()
-        entries = [e.model_dump() for e in registry.list_projects()]
+        entries = [e.model_dump() for e in registry.iter_projects()]
         await bus.emit_async(EventType.PROGRESS_UPDATE, {
             "command": "list_projects",
             "status": "complete",
@@ -6,7 +6,6 @@ IMPORTANT: Do NOT import transport, state, or command modules at module level.
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 from typing import Optional
 
@@ -213,6 +212,8 @@ def new_project(
     )
 
     # Lazy import of API function (uses workflow internally)
+    import asyncio
+
     from openclawpack.api import create_project as create_project_api
 
     bus = _make_cli_bus() if not quiet else None
@@ -266,6 +267,8 @@ def plan_phase(
     )
 
     # Lazy import of API function (uses workflow internally)
+    import asyncio
+
     from openclawpack.api import plan_phase as plan_phase_api
 
     bus = _make_cli_bus() if not quiet else None
@@ -319,6 +322,8 @@ def execute_phase(
     )
 
     # Lazy import of API function (uses workflow internally)
+    import asyncio
+
     from openclawpack.api import execute_phase as execute_phase_api
 
     bus = _make_cli_bus() if not quiet else None
@@ -10,11 +10,12 @@ PKG-04 (``openclawpack --version`` works without Claude Code).
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 
-from openclawpack.output.schema import CommandResult
+if TYPE_CHECKING:
+    from openclawpack.output.schema import CommandResult
 
 projects_app = typer.Typer(help="Manage registered projects.")
 
@@ -53,6 +54,7 @@ def add(
     ctx: typer.Context = typer.Context,
 ) -> None:
     """Register a GSD project in the multi-project registry."""
+    from openclawpack.output.schema import CommandResult
     from openclawpack.state.registry import ProjectRegistry
 
     try:
@@ -82,6 +84,7 @@ def list_projects(
     ctx: typer.Context = typer.Context,
 ) -> None:
     """List all registered projects."""
+    from openclawpack.output.schema import CommandResult
     from openclawpack.state.registry import ProjectRegistry
 
     try:
@@ -123,6 +126,7 @@ def remove(
     ctx: typer.Context = typer.Context,
 ) -> None:
     """Remove a project from the registry."""
+    from openclawpack.output.schema import CommandResult
     from openclawpack.state.registry import ProjectRegistry
 
     try:
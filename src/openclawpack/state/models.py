@@ -99,8 +99,10 @@ class PlanningDirectory(BaseModel):
     @property
     def overall_progress(self) -> float:
         """Calculate overall progress across all phases."""
-        total_plans = sum(p.plans_total for p in self.roadmap.phases)
-        complete_plans = sum(p.plans_complete for p in self.roadmap.phases)
+        total_plans = complete_plans = 0
+        for phase in self.roadmap.phases:
+            total_plans += phase.plans_total
+            complete_plans += phase.plans_complete
         if total_plans > 0:
             return complete_plans / total_plans * 100
         return 0.0
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import re
+import sys
 
 from openclawpack.state.models import (
     PhaseInfo,
@@ -14,6 +15,69 @@ from openclawpack.state.models import (
     RoadmapInfo,
 )
 
+# Patterns are compiled once at import so repeated parses skip re's cache.
+_CHECKBOX_RE = re.compile(r"^-\s+\[([ xX])\]\s+(.+)$", re.MULTILINE)
+# STATE.md "Current Position" fields, matched in one pass; the outer named
+# group of each alternative is reported as ``match.lastgroup``.
+_POSITION_RE = re.compile(
+    r"(?P<phase>Phase:\s*(?P<phase_num>\d+)\s+of\s+\d+\s*"
+    r"(?:\((?P<phase_name>[^)]+)\))?)"
+    r"|(?P<plan>Plan:\s*(?P<plans_done>\d+)\s+of\s+(?P<plans_total>\d+))"
+    r"|(?P<activity>Last activity:[ \t]*(?P<activity_text>[^\n]+))"
+)
+# One pass over "Phase Details": each alternative is reported as
+# ``match.lastgroup``.  A non-phase ``###`` heading ends the current phase.
+_PHASE_DETAILS_RE = re.compile(
+    r"(?P<phase>^###\s+Phase\s+(?P<number>\d+):\s+(?P<name>[^\n]+)\n)"
+    r"|(?P<heading>^###\s)"
+    r"|\*\*Goal\*\*:[ \t]*(?P<goal>[^\n]+)"
+    r"|\*\*Requirements\*\*:[ \t]*(?P<requirements>[^\n]+)"
+    r"|^-\s+\[(?P<plan>[ xX])\][ \t]+.+$",
+    re.MULTILINE,
+)
+_PHASE_NUM_RE = re.compile(r"(\d+)\.")
+_PLANS_COMPLETE_RE = re.compile(r"(\d+)/(\d+)")
+_DIGITS_RE = re.compile(r"(\d+)")
+_REQ_ITEM_RE = re.compile(
+    r"^-\s+\[([ xX])\]\s+\*\*([A-Z]+-\d+)\*\*:\s*(.+)$", re.MULTILINE
+)
+_H1_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_CONSTRAINT_RE = re.compile(r"-\s+\*\*[^*]+\*\*:\s*(.+)")
+
+
+# A line of one or more ``#`` followed by whitespace.  Any such line closes
+# every open section at its level or deeper.
+_HEADING_RE = re.compile(r"^(#+)(?=\s)(.*)$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=8)
+def _index_sections(content: str) -> dict[tuple[int, str], tuple[int, int]]:
+    """Map ``(level, header)`` to the body span of its first occurrence.
+
+    Headings are found in a single pass; each body runs from the end of
+    its heading line to the next heading of the same or a higher level.
+    Cached so the several ``extract_section`` calls a parser makes on one
+    document share the scan.
+    """
+    spans: dict[tuple[int, str], tuple[int, int]] = {}
+    open_sections: list[tuple[int, tuple[int, str] | None, int]] = []
+    for match in _HEADING_RE.finditer(content):
+        level = len(match.group(1))
+        while open_sections and open_sections[-1][0] >= level:
+            _, key, body_start = open_sections.pop()
+            if key is not None:
+                spans.setdefault(key, (body_start, match.start()))
+        # A heading needs text (even blank) on its line and a line break
+        # after it to own a body; a bare "#" line only closes sections.
+        key = None
+        if match.group(2) and match.end() < len(content):
+            key = (level, match.group(2).strip())
+        open_sections.append((level, key, match.end() + 1))
+    for _, key, body_start in open_sections:
+        if key is not None:
+            spans.setdefault(key, (body_start, len(content)))
+    return spans
+
 
 def extract_section(content: str, header: str, level: int = 2) -> str | None:
     """Extract markdown content under a heading.
@@ -26,17 +90,10 @@ def extract_section(content: str, header: str, level: int = 2) -> str | None:
     Returns:
         The text under that heading, or ``None`` if not found.
     """
-    prefix = "#" * level
-    # Match the target heading, capture everything until a same-or-higher-level heading or end
-    pattern = (
-        rf"^{re.escape(prefix)}\s+{re.escape(header)}\s*\n"
-        rf"(.*?)"
-        rf"(?=^#{{1,{level}}}\s|\Z)"
-    )
-    match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return None
+    span = _index_sections(content).get((level, header))
+    if span is None:
+        return None
+    return content[span[0] : span[1]].strip()
 
 
 def parse_checkbox_items(section: str) -> list[tuple[bool, str]]:
@@ -45,12 +102,11 @@ def parse_checkbox_items(section: str) -> list[tuple[bool, str]]:
     Returns:
         List of ``(checked, text)`` tuples.
     """
-    results: list[tuple[bool, str]] = []
-    for match in re.finditer(r"^-\s+\[([ xX])\]\s+(.+)$", section, re.MULTILINE):
-        checked = match.group(1).lower() == "x"
-        text = match.group(2).strip()
-        results.append((checked, text))
-    return results
+    # findall yields plain (mark, text) tuples without building Match objects;
+    # mark is one of " ", "x", "X".
+    return [
+        (mark != " ", text.strip()) for mark, text in _CHECKBOX_RE.findall(section)
+    ]
 
 
 def parse_table_rows(section: str) -> list[dict[str, str]]:
@@ -76,7 +132,9 @@ def parse_table_rows(section: str) -> list[dict[str, str]]:
     if header_line is None:
         return []
 
-    headers = [h.strip() for h in header_line.strip("|").split("|")]
+    # Interned so every row dict shares one key object per column label,
+    # which also matches the compiler-interned literals used in lookups.
+    headers = [sys.intern(h.strip()) for h in header_line.strip("|").split("|")]
 
     # Skip separator row (header_idx + 1), process data rows
     rows: list[dict[str, str]] = []
@@ -98,9 +156,13 @@ def parse_table_rows(section: str) -> list[dict[str, str]]:
 
 
 def parse_config_json(content: str) -> ProjectConfig:
-    """Parse config.json content into a ProjectConfig model."""
-    data = json.loads(content)
-    return ProjectConfig.model_validate(data)
+    """Parse config.json content into a ProjectConfig model.
+
+    Validates straight from the JSON text with pydantic's own parser rather
+    than building an intermediate dict via :mod:`json`.  Malformed JSON
+    raises :class:`pydantic.ValidationError` (a ``ValueError``).
+    """
+    return ProjectConfig.model_validate_json(content)
 
 
 def parse_state_md(content: str) -> ProjectState:
@@ -125,24 +187,26 @@ def parse_state_md(content: str) -> ProjectState:
     last_activity = None
 
     if position:
-        # "Phase: 1 of 5 (Foundation)"
-        phase_match = re.search(
-            r"Phase:\s*(\d+)\s+of\s+\d+\s*(?:\(([^)]+)\))?", position
-        )
-        if phase_match:
-            current_phase = int(phase_match.group(1))
-            current_phase_name = (phase_match.group(2) or "unknown").strip()
-
-        # "Plan: 1 of 3 in current phase"
-        plan_match = re.search(r"Plan:\s*(\d+)\s+of\s+(\d+)", position)
-        if plan_match:
-            plans_complete = int(plan_match.group(1))
-            plans_total = int(plan_match.group(2))
-
-        # "Last activity: 2026-02-21 -- Completed 01-01-PLAN.md"
-        activity_match = re.search(r"Last activity:\s*(.+)", position)
-        if activity_match:
-            last_activity = activity_match.group(1).strip()
+        seen: set[str] = set()
+        for match in _POSITION_RE.finditer(position):
+            # The first occurrence of each field wins.
+            field = match.lastgroup
+            if field in seen:
+                continue
+            seen.add(field)
+            if field == "phase":
+                # "Phase: 1 of 5 (Foundation)"
+                current_phase = int(match.group("phase_num"))
+                current_phase_name = (
+                    match.group("phase_name") or "unknown"
+                ).strip()
+            elif field == "plan":
+                # "Plan: 1 of 3 in current phase"
+                plans_complete = int(match.group("plans_done"))
+                plans_total = int(match.group("plans_total"))
+            else:
+                # "Last activity: 2026-02-21 -- Completed 01-01-PLAN.md"
+                last_activity = match.group("activity_text").strip()
 
     # --- Blockers ---
     blockers: list[str] = []
@@ -189,37 +253,45 @@ def parse_roadmap_md(content: str) -> RoadmapInfo:
     phases: list[PhaseInfo] = []
     phase_details = extract_section(content, "Phase Details")
     if phase_details:
-        # Find each ### Phase N: Name heading
-        phase_pattern = re.compile(
-            r"^###\s+Phase\s+(\d+):\s+([^\n]+)\n(.*?)(?=^###\s|\Z)",
-            re.MULTILINE | re.DOTALL,
-        )
-        for match in phase_pattern.finditer(phase_details):
-            number = int(match.group(1))
-            name = match.group(2).strip()
-            body = match.group(3)
-
-            goal = None
-            goal_match = re.search(r"\*\*Goal\*\*:\s*(.+)", body)
-            if goal_match:
-                goal = goal_match.group(1).strip()
-
+        current: dict | None = None
+        found: list[dict] = []
+        for match in _PHASE_DETAILS_RE.finditer(phase_details):
+            kind = match.lastgroup
+            if kind == "phase":
+                current = {
+                    "number": int(match.group("number")),
+                    "name": match.group("name").strip(),
+                    "goal": None,
+                    "requirements": None,
+                    "plans_total": 0,
+                    "plans_complete": 0,
+                }
+                found.append(current)
+            elif current is None:
+                continue
+            elif kind == "heading":
+                current = None
+            elif kind == "goal":
+                if current["goal"] is None:
+                    current["goal"] = match.group("goal").strip()
+            elif kind == "requirements":
+                if current["requirements"] is None:
+                    current["requirements"] = match.group("requirements")
+            else:
+                # Plan list items ("- [ ] ..." or "- [x] ...")
+                current["plans_total"] += 1
+                if match.group("plan") != " ":
+                    current["plans_complete"] += 1
+
+        for info in found:
             requirements: list[str] = []
-            req_match = re.search(r"\*\*Requirements\*\*:\s*(.+)", body)
-            if req_match:
+            if info["requirements"] is not None:
                 requirements = [
-                    r.strip() for r in req_match.group(1).split(",") if r.strip()
+                    r.strip() for r in info["requirements"].split(",") if r.strip()
                 ]
 
-            # Parse plan count from "**Plans**: N plans" or progress table
-            plans_total = 0
-            plans_complete = 0
-
-            # Count plan list items (lines starting with "- [ ]" or "- [x]")
-            plan_items = parse_checkbox_items(body)
-            if plan_items:
-                plans_total = len(plan_items)
-                plans_complete = sum(1 for checked, _ in plan_items if checked)
+            plans_total = info["plans_total"]
+            plans_complete = info["plans_complete"]
 
             # Determine status from progress table or infer
             status = "Not started"
@@ -230,9 +302,9 @@ def parse_roadmap_md(content: str) -> RoadmapInfo:
 
             phases.append(
                 PhaseInfo(
-                    number=number,
-                    name=name,
-                    goal=goal,
+                    number=info["number"],
+                    name=info["name"],
+                    goal=info["goal"],
                     requirements=requirements,
                     plans_complete=plans_complete,
                     plans_total=plans_total,
@@ -247,14 +319,14 @@ def parse_roadmap_md(content: str) -> RoadmapInfo:
         for row in rows:
             # Match phase by extracting number from "1. Foundation" format
             phase_col = row.get("Phase", "")
-            num_match = re.match(r"(\d+)\.", phase_col)
+            num_match = _PHASE_NUM_RE.match(phase_col)
             if num_match:
                 phase_num = int(num_match.group(1))
                 for phase in phases:
                     if phase.number == phase_num:
                         # Parse "1/3" format from "Plans Complete" column
                         plans_str = row.get("Plans Complete", "")
-                        pc_match = re.match(r"(\d+)/(\d+)", plans_str)
+                        pc_match = _PLANS_COMPLETE_RE.match(plans_str)
                         if pc_match:
                             phase.plans_complete = int(pc_match.group(1))
                             phase.plans_total = int(pc_match.group(2))
@@ -288,7 +360,7 @@ def parse_requirements_md(content: str) -> list[RequirementInfo]:
             req_id = row.get("Requirement", "").strip()
             phase_str = row.get("Phase", "").strip()
             phase_num = None
-            p_match = re.search(r"(\d+)", phase_str)
+            p_match = _DIGITS_RE.search(phase_str)
             if p_match:
                 phase_num = int(p_match.group(1))
             phase_map[req_id] = phase_num
@@ -297,10 +369,7 @@ def parse_requirements_md(content: str) -> list[RequirementInfo]:
     v1_section = extract_section(content, "v1 Requirements")
     if v1_section:
         # Match: - [ ] **REQ-ID**: Description  or  - [x] **REQ-ID**: Description
-        req_pattern = re.compile(
-            r"^-\s+\[([ xX])\]\s+\*\*([A-Z]+-\d+)\*\*:\s*(.+)$", re.MULTILINE
-        )
-        for match in req_pattern.finditer(v1_section):
+        for match in _REQ_ITEM_RE.finditer(v1_section):
             checked = match.group(1).lower() == "x"
             req_id = match.group(2)
             description = match.group(3).strip()
@@ -329,7 +398,7 @@ def parse_project_md(content: str) -> ProjectInfo:
 
     # --- Name from H1 ---
     name = "unknown"
-    h1_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+    h1_match = _H1_RE.search(content)
     if h1_match:
         name = h1_match.group(1).strip()
 
@@ -353,7 +422,7 @@ def parse_project_md(content: str) -> ProjectInfo:
             line = line.strip()
             if line.startswith("- **"):
                 # Extract text after closing **: e.g. "- **Runtime**: Python 3.10+"
-                c_match = re.match(r"-\s+\*\*[^*]+\*\*:\s*(.+)", line)
+                c_match = _CONSTRAINT_RE.match(line)
                 if c_match:
                     constraints.append(c_match.group(1).strip())
                 else:
@@ -6,6 +6,8 @@ Reads a .planning/ directory and returns a fully typed
 
 from __future__ import annotations
 
+import os
+from collections import OrderedDict
 from pathlib import Path
 
 from openclawpack.state.models import (
@@ -21,10 +23,57 @@ from openclawpack.state.parser import (
     parse_state_md,
 )
 
+# The .planning/ files read_project_state consults, in read order.
+_PLANNING_FILES = (
+    "config.json",
+    "STATE.md",
+    "PROJECT.md",
+    "ROADMAP.md",
+    "REQUIREMENTS.md",
+)
+
+# Parsed state per resolved .planning/ directory, alongside the file
+# stamp it was built from.  Least recently used entries are evicted past
+# _STATE_CACHE_SIZE so long-lived processes stay bounded.
+_STATE_CACHE: OrderedDict[Path, tuple[tuple, PlanningDirectory]] = OrderedDict()
+_STATE_CACHE_SIZE = 8
+
+
+def _scan_planning(planning_dir: Path) -> dict[str, os.DirEntry]:
+    """List the planning files present in *planning_dir* with one scandir.
+
+    Raises:
+        FileNotFoundError: If *planning_dir* does not exist.
+        NotADirectoryError: If *planning_dir* is not a directory.
+    """
+    with os.scandir(planning_dir) as it:
+        return {
+            entry.name: entry
+            for entry in it
+            if entry.name in _PLANNING_FILES and entry.is_file()
+        }
+
+
+def _planning_stamp(entries: dict[str, os.DirEntry]) -> tuple:
+    """Return ``(mtime_ns, size)`` for each planning file, ``None`` if absent."""
+    stamp = []
+    for name in _PLANNING_FILES:
+        entry = entries.get(name)
+        if entry is None:
+            stamp.append(None)
+        else:
+            st = entry.stat()
+            stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
 
 def read_project_state(project_dir: str | Path) -> PlanningDirectory:
     """Read and parse all .planning/ files into a PlanningDirectory model.
 
+    Parsed state is cached per directory and reused until one of the
+    planning files changes size or mtime; each call returns an independent
+    copy.  :func:`clear_state_cache` drops the cache.
+
     Args:
         project_dir: Path to the project root directory (containing .planning/).
 
@@ -35,53 +84,108 @@ def read_project_state(project_dir: str | Path) -> PlanningDirectory:
         FileNotFoundError: If the .planning/ directory does not exist, or if
             required files (STATE.md, PROJECT.md) are missing.
     """
+    return _cached_state(project_dir).model_copy(deep=True)
+
+
+def clear_state_cache() -> None:
+    """Drop all cached parsed planning state."""
+    _STATE_CACHE.clear()
+
+
+def _cached_state(project_dir: str | Path) -> PlanningDirectory:
+    """Return the shared cached PlanningDirectory, re-parsing if stale.
+
+    Callers must not mutate the result.
+    """
     project_path = Path(project_dir).resolve()
     planning_dir = project_path / ".planning"
 
-    if not planning_dir.is_dir():
+    try:
+        entries = _scan_planning(planning_dir)
+    except (FileNotFoundError, NotADirectoryError):
         raise FileNotFoundError(
             f"No .planning/ directory found at {project_path}. "
             "Is this a GSD-managed project?"
-        )
+        ) from None
+
+    stamp = _planning_stamp(entries)
+    cached = _STATE_CACHE.get(planning_dir)
+    if cached is not None and cached[0] == stamp:
+        _STATE_CACHE.move_to_end(planning_dir)
+        return cached[1]
+
+    pd = _parse_planning_dir(planning_dir, entries)
+    _STATE_CACHE[planning_dir] = (stamp, pd)
+    _STATE_CACHE.move_to_end(planning_dir)
+    if len(_STATE_CACHE) > _STATE_CACHE_SIZE:
+        _STATE_CACHE.popitem(last=False)
+    return pd
+
+
+def _read_if_file(path: str) -> str | None:
+    """Return the text of *path*, or ``None`` if it is missing or not a file.
+
+    Covers a file that disappears between the directory scan and the read.
+    Reads bytes and decodes once, skipping the text-IO layer; line endings
+    are normalised to ``\n`` as ``read_text`` would.
+    """
+    try:
+        with open(path, "rb") as fh:
+            text = fh.read().decode("utf-8")
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _parse_planning_dir(
+    planning_dir: Path, entries: dict[str, os.DirEntry]
+) -> PlanningDirectory:
+    """Read and parse the planning files listed in *entries*."""
+
+    def read(name: str) -> str | None:
+        entry = entries.get(name)
+        if entry is None:
+            return None
+        return _read_if_file(entry.path)
 
     # --- config.json (optional) ---
-    config_path = planning_dir / "config.json"
-    if config_path.is_file():
-        config = parse_config_json(config_path.read_text(encoding="utf-8"))
+    config_text = read("config.json")
+    if config_text is not None:
+        config = parse_config_json(config_text)
     else:
         config = ProjectConfig()
 
     # --- STATE.md (required) ---
-    state_path = planning_dir / "STATE.md"
-    if not state_path.is_file():
+    state_text = read("STATE.md")
+    if state_text is None:
         raise FileNotFoundError(
             f"Required file STATE.md not found in {planning_dir}. "
             "A GSD project must have a STATE.md file."
         )
-    state = parse_state_md(state_path.read_text(encoding="utf-8"))
+    state = parse_state_md(state_text)
 
     # --- PROJECT.md (required) ---
-    project_path_md = planning_dir / "PROJECT.md"
-    if not project_path_md.is_file():
+    project_text = read("PROJECT.md")
+    if project_text is None:
         raise FileNotFoundError(
             f"Required file PROJECT.md not found in {planning_dir}. "
             "A GSD project must have a PROJECT.md file."
         )
-    project = parse_project_md(project_path_md.read_text(encoding="utf-8"))
+    project = parse_project_md(project_text)
 
     # --- ROADMAP.md (optional) ---
-    roadmap_path = planning_dir / "ROADMAP.md"
-    if roadmap_path.is_file():
-        roadmap = parse_roadmap_md(roadmap_path.read_text(encoding="utf-8"))
+    roadmap_text = read("ROADMAP.md")
+    if roadmap_text is not None:
+        roadmap = parse_roadmap_md(roadmap_text)
     else:
         roadmap = RoadmapInfo()
 
     # --- REQUIREMENTS.md (optional) ---
-    requirements_path = planning_dir / "REQUIREMENTS.md"
-    if requirements_path.is_file():
-        requirements = parse_requirements_md(
-            requirements_path.read_text(encoding="utf-8")
-        )
+    requirements_text = read("REQUIREMENTS.md")
+    if requirements_text is not None:
+        requirements = parse_requirements_md(requirements_text)
     else:
         requirements = []
 
@@ -106,7 +210,7 @@ def get_project_summary(project_dir: str | Path) -> dict:
         A dict with keys: current_phase, current_phase_name,
         progress_percent, blockers, requirements_complete, requirements_total.
     """
-    pd = read_project_state(project_dir)
+    pd = _cached_state(project_dir)
 
     requirements_complete = sum(1 for r in pd.requirements if r.completed)
     requirements_total = len(pd.requirements)
@@ -115,7 +219,7 @@ def get_project_summary(project_dir: str | Path) -> dict:
         "current_phase": pd.state.current_phase,
         "current_phase_name": pd.state.current_phase_name,
         "progress_percent": pd.state.progress_percent,
-        "blockers": pd.state.blockers,
+        "blockers": list(pd.state.blockers),
         "requirements_complete": requirements_complete,
         "requirements_total": requirements_total,
     }
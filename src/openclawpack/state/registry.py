@@ -6,9 +6,11 @@ cross-platform user data directory.
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
 import tempfile
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -23,30 +25,65 @@ def _user_data_dir(appname: str = "openclawpack") -> Path:
     - Linux: $XDG_DATA_HOME/<appname> or ~/.local/share/<appname>
     - Windows: %LOCALAPPDATA%/<appname>
     """
-    if sys.platform == "win32":
-        base = Path(
-            os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local"))
+    env = os.environ
+    return _resolve_data_dir(
+        appname,
+        sys.platform,
+        env.get("LOCALAPPDATA"),
+        env.get("XDG_DATA_HOME"),
+        env.get("HOME"),
+        env.get("USERPROFILE"),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_data_dir(
+    appname: str,
+    platform: str,
+    localappdata: str | None,
+    xdg_data_home: str | None,
+    home: str | None,
+    userprofile: str | None,
+) -> Path:
+    """Resolve the data directory, memoised on every input it reads.
+
+    ``home`` and ``userprofile`` are only cache keys; ``Path.home()``
+    reads them itself.
+    """
+    if platform == "win32":
+        base = (
+            Path(localappdata)
+            if localappdata is not None
+            else Path.home() / "AppData" / "Local"
         )
-    elif sys.platform == "darwin":
+    elif platform == "darwin":
         base = Path.home() / "Library" / "Application Support"
     else:  # Linux / other Unix
-        xdg = os.environ.get("XDG_DATA_HOME")
-        base = Path(xdg) if xdg else Path.home() / ".local" / "share"
+        base = (
+            Path(xdg_data_home)
+            if xdg_data_home
+            else Path.home() / ".local" / "share"
+        )
     return base / appname
 
 
-def _atomic_write_json(path: Path, data: str) -> None:
-    """Atomically write a JSON string to a file.
+def _atomic_write_json(path: Path, data: bytes) -> None:
+    """Atomically write encoded JSON to a file.
 
-    Uses tempfile + os.replace to prevent corruption on crash.
+    Uses tempfile + os.replace to prevent corruption on crash. The
+    payload goes straight to the descriptor, with no file object in
+    between.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(data)
-            f.flush()
-            os.fsync(f.fileno())
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         os.replace(tmp_path, str(path))
     except BaseException:
         try:
@@ -84,10 +121,11 @@ class ProjectRegistry:
         if registry_path is None:
             registry_path = _user_data_dir() / "registry.json"
 
-        if not registry_path.exists():
+        try:
+            content = registry_path.read_bytes()
+        except FileNotFoundError:
             return cls(registry_path, ProjectRegistryData())
 
-        content = registry_path.read_text(encoding="utf-8")
         try:
             data = ProjectRegistryData.model_validate_json(content)
         except Exception as exc:
@@ -98,8 +136,8 @@ class ProjectRegistry:
 
     def save(self) -> None:
         """Persist the registry to disk using atomic write."""
-        json_str = self._data.model_dump_json(indent=2)
-        _atomic_write_json(self._path, json_str)
+        payload = self._data.model_dump_json(indent=2).encode("utf-8")
+        _atomic_write_json(self._path, payload)
 
     def add(
         self, path: str | Path, *, name: str | None = None
@@ -119,14 +157,14 @@ class ProjectRegistry:
         """
         project_path = Path(path)
 
-        # Validate path exists
-        if not project_path.exists():
+        # Resolve to absolute canonical path; strict resolution doubles
+        # as the existence check
+        try:
+            resolved = project_path.resolve(strict=True)
+        except (OSError, RuntimeError):  # RuntimeError: symlink loop (<3.13)
             raise ValueError(
                 f"Path does not exist: {project_path}"
-            )
-
-        # Resolve to absolute canonical path
-        resolved = project_path.resolve()
+            ) from None
 
         # Validate .planning/ directory
         if not (resolved / ".planning").is_dir():
@@ -187,10 +225,18 @@ class ProjectRegistry:
         self.save()
         return True
 
+    def iter_projects(self) -> Iterator[RegistryEntry]:
+        """Iterate over registered project entries without copying.
+
+        Yields:
+            RegistryEntry objects in registration order.
+        """
+        yield from self._data.projects.values()
+
     def list_projects(self) -> list[RegistryEntry]:
         """Return all registered project entries.
 
         Returns:
             A list of RegistryEntry objects.
         """
-        return list(self._data.projects.values())
+        return list(self.iter_projects())
@@ -1 +1,15 @@
 """OpenClawPack test configuration."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run ``@pytest.mark.anyio`` tests on asyncio only.
+
+    The CLI drives workflows with ``asyncio.run`` and the transport uses
+    ``asyncio.timeout``, so trio runs would only exercise an unsupported
+    backend. Session-scoped so it is resolved once, and so wider-scoped
+    async fixtures can share the same backend.
+    """
+    return "asyncio"
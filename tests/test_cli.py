@@ -7,30 +7,67 @@ Verifies both gap fixes from 02-VERIFICATION.md:
 All tests mock workflow functions -- no real Claude Code invocations.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import inspect
+import subprocess
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
-from typer.testing import CliRunner
+from click.testing import CliRunner
+from typer.main import get_command
 
+import openclawpack
 from openclawpack.cli import app
 from openclawpack.output.schema import CommandResult
 
 runner = CliRunner()
 
 
+@pytest.fixture(scope="module")
+def cli_cmd():
+    """Build the Click command for ``app`` once and reuse it per module.
+
+    Typer's ``CliRunner.invoke`` re-translates the app into a Click command
+    on every call; invoking the prebuilt command through Click's runner
+    lets every test share a single translation.
+    """
+    return get_command(app)
+
+
+@pytest.fixture(scope="module")
+def helps(cli_cmd) -> dict[str | None, str]:
+    """Render each ``--help`` page once per module, keyed by subcommand.
+
+    ``None`` holds the top-level ``openclawpack --help`` output.
+    """
+    pages: dict[str | None, str] = {}
+    for cmd in (None, "new-project", "plan-phase", "execute-phase", "status"):
+        argv = [cmd, "--help"] if cmd else ["--help"]
+        pages[cmd] = runner.invoke(cli_cmd, argv).output
+    return pages
+
+
 # ── Helpers ──────────────────────────────────────────────────────
 
 
-def _ok_result() -> CommandResult:
-    """Return a minimal successful CommandResult."""
-    return CommandResult.ok(result={"status": "ok"}, duration_ms=1)
+# Validated once at import. The status command fills in ``usage`` in place,
+# so status tests hand out ``model_copy()``s rather than the shared instance.
+_OK_RESULT = CommandResult.ok(result={"status": "ok"}, duration_ms=1)
+
 
+def _mock_engine() -> SimpleNamespace:
+    """Create a stub WorkflowEngine whose run_gsd_command returns ok.
 
-def _mock_engine() -> MagicMock:
-    """Create a mock WorkflowEngine whose run_gsd_command returns ok."""
-    engine = MagicMock()
-    engine.run_gsd_command = AsyncMock(return_value=_ok_result())
-    return engine
+    Calls are recorded as ``(args, kwargs)`` tuples in ``engine._calls``.
+    """
+    calls: list[tuple[tuple, dict]] = []
+
+    async def _run_gsd(*args, **kwargs) -> CommandResult:
+        calls.append((args, kwargs))
+        return _OK_RESULT
+
+    return SimpleNamespace(run_gsd_command=_run_gsd, _calls=calls)
 
 
 # Patch targets for workflow functions (at source module)
@@ -43,47 +80,57 @@ _EXECUTE_PHASE_WF = "openclawpack.commands.execute_phase.execute_phase_workflow"
 _ENGINE_PATCH = "openclawpack.commands.engine.WorkflowEngine"
 
 
+@pytest.fixture(autouse=True)
+def mock_engines(monkeypatch: pytest.MonkeyPatch) -> list[SimpleNamespace]:
+    """Install a mock WorkflowEngine for every test in this module.
+
+    Returns the list of engines constructed during the test so call
+    arguments can be inspected after the CLI has run.
+    """
+    created: list[SimpleNamespace] = []
+
+    def _factory(*args, **kwargs) -> SimpleNamespace:
+        engine = _mock_engine()
+        created.append(engine)
+        return engine
+
+    monkeypatch.setattr(_ENGINE_PATCH, _factory)
+    return created
+
+
 # ── TestNewProjectIdeaFlag ───────────────────────────────────────
 
 
 class TestNewProjectIdeaFlag:
     """Tests for the --idea named option on new-project command."""
 
-    def test_idea_as_named_option(self) -> None:
+    def test_idea_as_named_option(self, cli_cmd) -> None:
         """new-project --idea 'text' should parse and call workflow with idea text."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            result = runner.invoke(app, ["new-project", "--idea", "build a todo app"])
+        result = runner.invoke(cli_cmd, ["new-project", "--idea", "build a todo app"])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
 
-    def test_idea_as_positional_arg(self) -> None:
+    def test_idea_as_positional_arg(self, cli_cmd) -> None:
         """new-project 'text' (positional) should still work for backward compat."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            result = runner.invoke(app, ["new-project", "build a todo app"])
+        result = runner.invoke(cli_cmd, ["new-project", "build a todo app"])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
 
-    def test_idea_option_takes_precedence(self) -> None:
+    def test_idea_option_takes_precedence(self, cli_cmd, mock_engines) -> None:
         """When both positional and --idea provided, --idea takes precedence."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()) as mock_cls:
-            result = runner.invoke(
-                app,
-                ["new-project", "ignored positional", "--idea", "preferred"],
-            )
+        result = runner.invoke(
+            cli_cmd,
+            ["new-project", "ignored positional", "--idea", "preferred"],
+        )
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         # The workflow should have been called with idea="preferred"
-        mock_engine = mock_cls.return_value
-        call_kwargs = mock_engine.run_gsd_command.call_args
-        # run_gsd_command is called with command= and prompt= kwargs
+        call_args = mock_engines[-1]._calls[-1]
         # The prompt should contain the preferred idea text
-        prompt_text = call_kwargs[1].get("prompt", "") if call_kwargs[1] else ""
-        if not prompt_text and call_kwargs[0]:
-            prompt_text = str(call_kwargs)
-        assert "preferred" in str(call_kwargs), (
-            f"Expected 'preferred' in workflow call, got: {call_kwargs}"
+        assert "preferred" in str(call_args), (
+            f"Expected 'preferred' in workflow call, got: {call_args}"
         )
 
-    def test_no_idea_errors(self) -> None:
+    def test_no_idea_errors(self, cli_cmd) -> None:
         """new-project with no idea argument and no --idea should fail."""
-        result = runner.invoke(app, ["new-project"])
+        result = runner.invoke(cli_cmd, ["new-project"])
         assert result.exit_code != 0, (
             f"Expected non-zero exit code, got {result.exit_code}"
         )
@@ -95,65 +142,60 @@ class TestNewProjectIdeaFlag:
 class TestPerCommandOptions:
     """Tests for --project-dir, --verbose, --quiet placed after subcommand."""
 
-    def test_status_project_dir_after_subcommand(self) -> None:
+    def test_status_project_dir_after_subcommand(self, cli_cmd) -> None:
         """status --project-dir . should parse (options after subcommand)."""
-        with patch(_STATUS_WF, return_value=_ok_result()) as mock_wf:
-            result = runner.invoke(app, ["status", "--project-dir", "/tmp"])
+        with patch(_STATUS_WF, return_value=_OK_RESULT.model_copy()) as mock_wf:
+            result = runner.invoke(cli_cmd, ["status", "--project-dir", "/tmp"])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         mock_wf.assert_called_once()
         assert mock_wf.call_args[1]["project_dir"] == "/tmp"
 
-    def test_plan_phase_verbose_after_subcommand(self) -> None:
+    def test_plan_phase_verbose_after_subcommand(self, cli_cmd) -> None:
         """plan-phase --verbose 1 should parse without exit code 2."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            result = runner.invoke(app, ["plan-phase", "--verbose", "1"])
+        result = runner.invoke(cli_cmd, ["plan-phase", "--verbose", "1"])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
 
-    def test_execute_phase_quiet_after_subcommand(self) -> None:
+    def test_execute_phase_quiet_after_subcommand(self, cli_cmd) -> None:
         """execute-phase --quiet 1 should parse without exit code 2."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            result = runner.invoke(app, ["execute-phase", "--quiet", "1"])
+        result = runner.invoke(cli_cmd, ["execute-phase", "--quiet", "1"])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
 
-    def test_global_project_dir_still_works(self) -> None:
+    def test_global_project_dir_still_works(self, cli_cmd) -> None:
         """--project-dir before subcommand (global) should still work."""
-        with patch(_STATUS_WF, return_value=_ok_result()) as mock_wf:
-            result = runner.invoke(app, ["--project-dir", "/tmp", "status"])
+        with patch(_STATUS_WF, return_value=_OK_RESULT.model_copy()) as mock_wf:
+            result = runner.invoke(cli_cmd, ["--project-dir", "/tmp", "status"])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         mock_wf.assert_called_once()
         assert mock_wf.call_args[1]["project_dir"] == "/tmp"
 
-    def test_new_project_verbose_after_subcommand(self) -> None:
+    def test_new_project_verbose_after_subcommand(self, cli_cmd) -> None:
         """new-project --verbose --idea 'text' should parse correctly."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            result = runner.invoke(
-                app, ["new-project", "--verbose", "--idea", "test idea"]
-            )
+        result = runner.invoke(
+            cli_cmd, ["new-project", "--verbose", "--idea", "test idea"]
+        )
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
 
-    def test_new_project_project_dir_after_subcommand(self) -> None:
+    def test_new_project_project_dir_after_subcommand(self, cli_cmd) -> None:
         """new-project --project-dir /tmp --idea 'text' should parse correctly."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            result = runner.invoke(
-                app,
-                ["new-project", "--project-dir", "/tmp", "--idea", "test idea"],
-            )
+        result = runner.invoke(
+            cli_cmd,
+            ["new-project", "--project-dir", "/tmp", "--idea", "test idea"],
+        )
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
 
-    def test_status_quiet_after_subcommand(self) -> None:
+    def test_status_quiet_after_subcommand(self, cli_cmd) -> None:
         """status --quiet should suppress output."""
-        with patch(_STATUS_WF, return_value=_ok_result()):
-            result = runner.invoke(app, ["status", "--quiet"])
+        with patch(_STATUS_WF, return_value=_OK_RESULT.model_copy()):
+            result = runner.invoke(cli_cmd, ["status", "--quiet"])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         # With --quiet, no JSON output should be printed
         assert result.output.strip() == ""
 
-    def test_execute_phase_project_dir_after_subcommand(self) -> None:
+    def test_execute_phase_project_dir_after_subcommand(self, cli_cmd) -> None:
         """execute-phase --project-dir /tmp 1 should parse correctly."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            result = runner.invoke(
-                app, ["execute-phase", "--project-dir", "/tmp", "1"]
-            )
+        result = runner.invoke(
+            cli_cmd, ["execute-phase", "--project-dir", "/tmp", "1"]
+        )
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
 
 
@@ -163,30 +205,37 @@ class TestPerCommandOptions:
 class TestOutputFormat:
     """Tests for --output-format flag."""
 
-    def test_output_format_flag_in_global_help(self) -> None:
+    def test_output_format_flag_in_global_help(self, helps) -> None:
         """--output-format appears in global help."""
-        result = runner.invoke(app, ["--help"])
-        assert "--output-format" in result.output
+        assert "--output-format" in helps[None]
 
-    def test_output_format_json_default_status(self) -> None:
+    def test_output_format_json_default_status(self, cli_cmd) -> None:
         """Default output format is JSON (contains 'success' key)."""
-        with patch(_STATUS_WF, return_value=_ok_result()):
-            result = runner.invoke(app, ["status"])
+        with patch(_STATUS_WF, return_value=_OK_RESULT.model_copy()):
+            result = runner.invoke(cli_cmd, ["status"])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         assert '"success"' in result.output
 
-    def test_output_format_text_status(self) -> None:
-        """--output-format text produces human-readable output."""
-        with patch(_STATUS_WF, return_value=_ok_result()):
-            result = runner.invoke(
-                app, ["--output-format", "text", "status"]
-            )
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["status"],
+            ["new-project", "--idea", "test idea"],
+            ["plan-phase", "1"],
+            ["execute-phase", "1"],
+        ],
+        ids=["status", "new-project", "plan-phase", "execute-phase"],
+    )
+    def test_output_format_text(self, cli_cmd, argv: list[str]) -> None:
+        """--output-format text produces human-readable output on every command."""
+        with patch(_STATUS_WF, return_value=_OK_RESULT.model_copy()):
+            result = runner.invoke(cli_cmd, ["--output-format", "text", *argv])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         assert "Status: SUCCESS" in result.output
         # Should NOT be JSON
         assert '"success"' not in result.output
 
-    def test_output_format_text_with_usage(self) -> None:
+    def test_output_format_text_with_usage(self, cli_cmd) -> None:
         """--output-format text shows Tokens and Cost when usage is present."""
         ok_with_usage = CommandResult.ok(
             result="project info",
@@ -199,40 +248,12 @@ class TestOutputFormat:
         )
         with patch(_STATUS_WF, return_value=ok_with_usage):
             result = runner.invoke(
-                app, ["--output-format", "text", "status"]
+                cli_cmd, ["--output-format", "text", "status"]
             )
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         assert "Tokens: 1,500 input / 300 output" in result.output
         assert "Cost: $0.0123" in result.output
 
-    def test_output_format_text_new_project(self) -> None:
-        """--output-format text works on new-project command."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            result = runner.invoke(
-                app,
-                ["--output-format", "text", "new-project", "--idea", "test idea"],
-            )
-        assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
-        assert "Status: SUCCESS" in result.output
-
-    def test_output_format_text_plan_phase(self) -> None:
-        """--output-format text works on plan-phase command."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            result = runner.invoke(
-                app, ["--output-format", "text", "plan-phase", "1"]
-            )
-        assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
-        assert "Status: SUCCESS" in result.output
-
-    def test_output_format_text_execute_phase(self) -> None:
-        """--output-format text works on execute-phase command."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            result = runner.invoke(
-                app, ["--output-format", "text", "execute-phase", "1"]
-            )
-        assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
-        assert "Status: SUCCESS" in result.output
-
 
 # ── TestStatusZeroUsage ──────────────────────────────────────────
 
@@ -240,29 +261,27 @@ class TestOutputFormat:
 class TestStatusZeroUsage:
     """Status command returns zero usage instead of None."""
 
-    def test_status_has_zero_usage(self) -> None:
+    def test_status_has_zero_usage(self, cli_cmd) -> None:
         """Status command fills in zero usage when workflow returns None."""
         ok_no_usage = CommandResult.ok(result="info", duration_ms=10)
         assert ok_no_usage.usage is None  # Confirm starting state
 
         with patch(_STATUS_WF, return_value=ok_no_usage):
-            result = runner.invoke(app, ["status"])
+            result = runner.invoke(cli_cmd, ["status"])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         # The JSON should contain usage with zero tokens
-        import json
-
-        parsed = json.loads(result.output)
-        assert parsed["usage"] is not None
-        assert parsed["usage"]["input_tokens"] == 0
-        assert parsed["usage"]["output_tokens"] == 0
-        assert parsed["usage"]["total_cost_usd"] == 0.0
+        parsed = CommandResult.model_validate_json(result.output)
+        assert parsed.usage is not None
+        assert parsed.usage["input_tokens"] == 0
+        assert parsed.usage["output_tokens"] == 0
+        assert parsed.usage["total_cost_usd"] == 0.0
 
-    def test_status_text_format_has_zero_usage(self) -> None:
+    def test_status_text_format_has_zero_usage(self, cli_cmd) -> None:
         """Status command with --output-format text shows zero tokens."""
         ok_no_usage = CommandResult.ok(result="info", duration_ms=10)
         with patch(_STATUS_WF, return_value=ok_no_usage):
             result = runner.invoke(
-                app, ["--output-format", "text", "status"]
+                cli_cmd, ["--output-format", "text", "status"]
             )
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         assert "Tokens: 0 input / 0 output" in result.output
@@ -275,41 +294,61 @@ class TestStatusZeroUsage:
 class TestResumeFlag:
     """Tests for --resume flag on CLI commands."""
 
-    def test_resume_in_new_project_help(self) -> None:
-        result = runner.invoke(app, ["new-project", "--help"])
-        assert "--resume" in result.output
+    def test_resume_in_new_project_help(self, helps) -> None:
+        assert "--resume" in helps["new-project"]
 
-    def test_resume_in_plan_phase_help(self) -> None:
-        result = runner.invoke(app, ["plan-phase", "--help"])
-        assert "--resume" in result.output
+    def test_resume_in_plan_phase_help(self, helps) -> None:
+        assert "--resume" in helps["plan-phase"]
 
-    def test_resume_in_execute_phase_help(self) -> None:
-        result = runner.invoke(app, ["execute-phase", "--help"])
-        assert "--resume" in result.output
+    def test_resume_in_execute_phase_help(self, helps) -> None:
+        assert "--resume" in helps["execute-phase"]
 
-    def test_resume_not_in_status_help(self) -> None:
+    def test_resume_not_in_status_help(self, helps) -> None:
         """Status is local-only -- no --resume flag."""
-        result = runner.invoke(app, ["status", "--help"])
-        assert "--resume" not in result.output
+        assert "--resume" not in helps["status"]
 
 
 # ── TestPackageImports ──────────────────────────────────────────
 
 
+_EXPECTED_ALL = frozenset({
+    "__version__",
+    "create_project",
+    "plan_phase",
+    "execute_phase",
+    "get_status",
+    "add_project",
+    "list_projects",
+    "remove_project",
+    "EventBus",
+    "EventType",
+    "Event",
+})
+
+
 class TestPackageImports:
     """Tests for lazy __getattr__ re-exports in openclawpack.__init__."""
 
-    def test_version_still_works(self) -> None:
+    def test_version_still_works(self, cli_cmd) -> None:
         """openclawpack --version still works (PKG-04)."""
-        result = runner.invoke(app, ["--version"])
+        result = runner.invoke(cli_cmd, ["--version"])
         assert result.exit_code == 0
         assert "openclawpack" in result.output
 
+    def test_cli_import_skips_pydantic_and_asyncio(self) -> None:
+        """Importing the CLI defers pydantic and asyncio to command bodies."""
+        code = (
+            "import sys, openclawpack.cli; "
+            "print(sorted(m for m in ('asyncio', 'pydantic') if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "[]"
+
     def test_import_create_project(self) -> None:
         from openclawpack import create_project
 
-        import inspect
-
         assert inspect.iscoroutinefunction(create_project)
 
     def test_import_event_types(self) -> None:
@@ -322,33 +361,14 @@ class TestPackageImports:
     def test_import_get_status_is_coroutine(self) -> None:
         from openclawpack import get_status
 
-        import inspect
-
         assert inspect.iscoroutinefunction(get_status)
 
     def test_nonexistent_attribute_raises(self) -> None:
-        import openclawpack
-
         with pytest.raises(AttributeError):
             _ = openclawpack.nonexistent_attribute
 
     def test_all_contains_expected_names(self) -> None:
-        import openclawpack
-
-        expected = {
-            "__version__",
-            "create_project",
-            "plan_phase",
-            "execute_phase",
-            "get_status",
-            "add_project",
-            "list_projects",
-            "remove_project",
-            "EventBus",
-            "EventType",
-            "Event",
-        }
-        assert expected == set(openclawpack.__all__)
+        assert _EXPECTED_ALL == frozenset(openclawpack.__all__)
 
 
 # ── TestProjectsSubcommand ──────────────────────────────────────
@@ -357,18 +377,17 @@ class TestPackageImports:
 class TestProjectsSubcommand:
     """Tests for projects subcommand registration."""
 
-    def test_projects_help(self) -> None:
+    def test_projects_help(self, cli_cmd) -> None:
         """openclawpack projects --help shows add, list, remove."""
-        result = runner.invoke(app, ["projects", "--help"])
+        result = runner.invoke(cli_cmd, ["projects", "--help"])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         assert "add" in result.output
         assert "list" in result.output
         assert "remove" in result.output
 
-    def test_projects_in_main_help(self) -> None:
+    def test_projects_in_main_help(self, helps) -> None:
         """openclawpack --help shows projects subcommand."""
-        result = runner.invoke(app, ["--help"])
-        assert "projects" in result.output
+        assert "projects" in helps[None]
 
 
 # ── TestMakeCliBus ──────────────────────────────────────────────
@@ -401,27 +420,22 @@ class TestMakeCliBus:
 class TestCliEventBusWiring:
     """Tests for event bus wiring in CLI commands."""
 
-    def test_quiet_mode_no_bus_created(self) -> None:
-        """When --quiet is set, no EventBus should be created."""
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            with patch("openclawpack.cli._make_cli_bus") as mock_bus:
-                result = runner.invoke(
-                    app, ["new-project", "--quiet", "--idea", "test"]
-                )
-            assert result.exit_code == 0
-            mock_bus.assert_not_called()
-
-    def test_normal_mode_bus_created(self) -> None:
-        """Without --quiet, _make_cli_bus is called."""
+    @pytest.mark.parametrize(
+        "flags, expect_bus",
+        [(["--quiet"], False), ([], True)],
+        ids=["quiet", "normal"],
+    )
+    def test_bus_created_unless_quiet(
+        self, cli_cmd, flags: list[str], expect_bus: bool
+    ) -> None:
+        """_make_cli_bus is called once normally and never under --quiet."""
         from openclawpack.events import EventBus
 
-        real_bus = EventBus()
-        with patch(_ENGINE_PATCH, return_value=_mock_engine()):
-            with patch(
-                "openclawpack.cli._make_cli_bus", return_value=real_bus
-            ) as mock_bus:
-                result = runner.invoke(
-                    app, ["new-project", "--idea", "test"]
-                )
-            assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
-            mock_bus.assert_called_once()
+        with patch(
+            "openclawpack.cli._make_cli_bus", return_value=EventBus()
+        ) as mock_bus:
+            result = runner.invoke(
+                cli_cmd, ["new-project", *flags, "--idea", "test"]
+            )
+        assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
+        assert mock_bus.call_count == (1 if expect_bus else 0)
@@ -7,10 +7,17 @@ unit tests.
 
 from __future__ import annotations
 
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from openclawpack.commands.answers import (
+    build_answer_callback,
+    build_hooks_dict,
+    build_noop_pretool_hook,
+)
+
 
 # ── Fixtures ─────────────────────────────────────────────────────
 
@@ -22,133 +29,122 @@ class FakePermissionResultAllow:
         self.updated_input = updated_input
 
 
-@pytest.fixture()
-def _mock_sdk(monkeypatch):
-    """Patch claude_agent_sdk.PermissionResultAllow for all tests in this module."""
+@pytest.fixture(scope="class")
+def _mock_sdk():
+    """Patch claude_agent_sdk.PermissionResultAllow once per test class.
+
+    The fake is stateless, so a single install/undo around the whole class
+    is enough; the real SDK module is restored for the tests that follow.
+    """
     mock_module = MagicMock()
     mock_module.PermissionResultAllow = FakePermissionResultAllow
-    monkeypatch.setitem(
-        __import__("sys").modules, "claude_agent_sdk", mock_module
-    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "claude_agent_sdk", mock_module)
+        yield
 
 
 # ── build_answer_callback tests ──────────────────────────────────
 
 
+# Read-only AskUserQuestion payloads shared across parametrized cases.
+_TI_DEPTH = {
+    "questions": [
+        {"question": "What depth level?", "options": [{"label": "1"}, {"label": "3"}]}
+    ]
+}
+_TI_DEPTH_FREE = {
+    "questions": [{"question": "What depth level?", "options": []}]
+}
+_TI_DEPTH_MIXED_CASE = {
+    "questions": [
+        {"question": "What Depth level do you prefer?", "options": []}
+    ]
+}
+_TI_UNKNOWN = {
+    "questions": [
+        {
+            "question": "Unknown question?",
+            "options": [{"label": "Alpha"}, {"label": "Beta"}],
+        }
+    ]
+}
+_TI_FREE_TEXT = {"questions": [{"question": "Free text?"}]}
+_TI_MULTIPLE = {
+    "questions": [
+        {"question": "Choose depth level", "options": []},
+        {"question": "Enable parallelization?", "options": [{"label": "Yes"}, {"label": "No"}]},
+    ]
+}
+
+
 @pytest.mark.usefixtures("_mock_sdk")
 class TestBuildAnswerCallback:
     """Test the can_use_tool callback created by build_answer_callback."""
 
     @pytest.mark.anyio
-    async def test_exact_match(self) -> None:
-        """Exact key match returns mapped value."""
-        from openclawpack.commands.answers import build_answer_callback
-
-        callback = build_answer_callback({"What depth level?": "3"})
-        tool_input = {
-            "questions": [
-                {"question": "What depth level?", "options": [{"label": "1"}, {"label": "3"}]}
-            ]
-        }
+    @pytest.mark.parametrize(
+        "answer_map, tool_input, expected",
+        [
+            pytest.param(
+                {"What depth level?": "3"},
+                _TI_DEPTH,
+                {"What depth level?": "3"},
+                id="exact_match",
+            ),
+            pytest.param(
+                {"depth": "5"},
+                _TI_DEPTH_MIXED_CASE,
+                {"What Depth level do you prefer?": "5"},
+                id="substring_match_case_insensitive",
+            ),
+            pytest.param(
+                {},
+                _TI_UNKNOWN,
+                {"Unknown question?": "Alpha"},
+                id="fallback_to_first_option",
+            ),
+            pytest.param(
+                {},
+                _TI_FREE_TEXT,
+                {"Free text?": ""},
+                id="fallback_empty_string_no_options",
+            ),
+            pytest.param(
+                {"depth": "3", "parallelization": "Yes"},
+                _TI_MULTIPLE,
+                {"Choose depth level": "3", "Enable parallelization?": "Yes"},
+                id="multiple_questions",
+            ),
+            pytest.param(
+                {"depth": "substring-val", "What depth level?": "exact-val"},
+                _TI_DEPTH_FREE,
+                {"What depth level?": "exact-val"},
+                id="exact_match_takes_precedence",
+            ),
+        ],
+    )
+    async def test_answers(
+        self,
+        answer_map: dict[str, str],
+        tool_input: dict,
+        expected: dict[str, str],
+    ) -> None:
+        """Each question resolves via exact, substring, then fallback matching."""
+        callback = build_answer_callback(answer_map)
 
         result = await callback("AskUserQuestion", tool_input, None)
         assert isinstance(result, FakePermissionResultAllow)
-        assert result.updated_input["answers"]["What depth level?"] == "3"
-
-    @pytest.mark.anyio
-    async def test_substring_match_case_insensitive(self) -> None:
-        """Substring key match is case-insensitive."""
-        from openclawpack.commands.answers import build_answer_callback
-
-        callback = build_answer_callback({"depth": "5"})
-        tool_input = {
-            "questions": [
-                {"question": "What Depth level do you prefer?", "options": []}
-            ]
-        }
-
-        result = await callback("AskUserQuestion", tool_input, None)
-        assert result.updated_input["answers"]["What Depth level do you prefer?"] == "5"
-
-    @pytest.mark.anyio
-    async def test_fallback_to_first_option(self) -> None:
-        """When no match found, selects first option label."""
-        from openclawpack.commands.answers import build_answer_callback
-
-        callback = build_answer_callback({})
-        tool_input = {
-            "questions": [
-                {
-                    "question": "Unknown question?",
-                    "options": [{"label": "Alpha"}, {"label": "Beta"}],
-                }
-            ]
-        }
-
-        result = await callback("AskUserQuestion", tool_input, None)
-        assert result.updated_input["answers"]["Unknown question?"] == "Alpha"
-
-    @pytest.mark.anyio
-    async def test_fallback_empty_string_no_options(self) -> None:
-        """When no match and no options, uses empty string."""
-        from openclawpack.commands.answers import build_answer_callback
-
-        callback = build_answer_callback({})
-        tool_input = {
-            "questions": [{"question": "Free text?"}]
-        }
-
-        result = await callback("AskUserQuestion", tool_input, None)
-        assert result.updated_input["answers"]["Free text?"] == ""
+        assert result.updated_input["answers"] == expected
 
     @pytest.mark.anyio
     async def test_non_ask_tool_passes_through(self) -> None:
         """Non-AskUserQuestion tools get a plain PermissionResultAllow."""
-        from openclawpack.commands.answers import build_answer_callback
-
         callback = build_answer_callback({"irrelevant": "value"})
 
         result = await callback("Read", {"file_path": "/tmp/x"}, None)
         assert isinstance(result, FakePermissionResultAllow)
         assert result.updated_input is None
 
-    @pytest.mark.anyio
-    async def test_multiple_questions(self) -> None:
-        """Multiple questions are each resolved independently."""
-        from openclawpack.commands.answers import build_answer_callback
-
-        callback = build_answer_callback({
-            "depth": "3",
-            "parallelization": "Yes",
-        })
-        tool_input = {
-            "questions": [
-                {"question": "Choose depth level", "options": []},
-                {"question": "Enable parallelization?", "options": [{"label": "Yes"}, {"label": "No"}]},
-            ]
-        }
-
-        result = await callback("AskUserQuestion", tool_input, None)
-        answers = result.updated_input["answers"]
-        assert answers["Choose depth level"] == "3"
-        assert answers["Enable parallelization?"] == "Yes"
-
-    @pytest.mark.anyio
-    async def test_exact_match_takes_precedence(self) -> None:
-        """Exact match wins over substring match."""
-        from openclawpack.commands.answers import build_answer_callback
-
-        callback = build_answer_callback({
-            "depth": "substring-val",
-            "What depth level?": "exact-val",
-        })
-        tool_input = {
-            "questions": [{"question": "What depth level?", "options": []}]
-        }
-
-        result = await callback("AskUserQuestion", tool_input, None)
-        assert result.updated_input["answers"]["What depth level?"] == "exact-val"
-
 
 # ── build_noop_pretool_hook tests ────────────────────────────────
 
@@ -157,24 +153,18 @@ class TestBuildNoopPretoolHook:
     """Test that build_noop_pretool_hook returns a valid async callable."""
 
     def test_returns_callable(self) -> None:
-        from openclawpack.commands.answers import build_noop_pretool_hook
-
         hook = build_noop_pretool_hook()
         assert callable(hook)
 
     @pytest.mark.anyio
     async def test_hook_accepts_three_args(self) -> None:
         """Hook accepts 3-parameter SDK HookCallback signature and returns dict."""
-        from openclawpack.commands.answers import build_noop_pretool_hook
-
         hook = build_noop_pretool_hook()
         result = await hook("fake_input", "tool-123", "fake_context")
         assert result == {}
 
     def test_each_call_returns_new_instance(self) -> None:
         """Each call creates a distinct function object."""
-        from openclawpack.commands.answers import build_noop_pretool_hook
-
         hook1 = build_noop_pretool_hook()
         hook2 = build_noop_pretool_hook()
         assert hook1 is not hook2
@@ -190,8 +180,6 @@ class TestBuildHooksDict:
         """build_hooks_dict returns {PreToolUse: [HookMatcher(...)]}."""
         from claude_agent_sdk import HookMatcher
 
-        from openclawpack.commands.answers import build_hooks_dict
-
         result = build_hooks_dict()
         assert "PreToolUse" in result
         assert isinstance(result["PreToolUse"], list)
@@ -200,8 +188,6 @@ class TestBuildHooksDict:
 
     def test_hookmatcher_contains_callback(self) -> None:
         """HookMatcher.hooks list contains exactly one callable."""
-        from openclawpack.commands.answers import build_hooks_dict
-
         result = build_hooks_dict()
         matcher = result["PreToolUse"][0]
         assert len(matcher.hooks) == 1
@@ -11,9 +11,52 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+import openclawpack.transport.client as client_mod
 from openclawpack.commands import DEFAULT_TIMEOUTS
+from openclawpack.commands.engine import WorkflowEngine
+from openclawpack.output.schema import CommandResult
 
-_TRANSPORT_PATCH = "openclawpack.transport.client.ClaudeTransport"
+# Returned by every mocked transport run; the engine never mutates it.
+_DEFAULT_OK = CommandResult.ok(result="done")
+
+
+_CONFIG_FIELDS = ("timeout_seconds", "cwd", "system_prompt", "setting_sources")
+
+
+async def _ok_run(prompt, **kwargs):
+    return _DEFAULT_OK
+
+
+def _capturing_transport(
+    captured: dict,
+    mock_run=_ok_run,
+    fields: tuple[str, ...] = _CONFIG_FIELDS,
+):
+    """Build a ClaudeTransport side_effect that records config fields.
+
+    Each named TransportConfig attribute is copied into ``captured`` when
+    the engine constructs its transport; the returned instance's ``run``
+    is ``mock_run``.
+    """
+
+    def side_effect(config):
+        for field in fields:
+            captured[field] = getattr(config, field, None)
+        instance = MagicMock()
+        instance.run = mock_run
+        return instance
+
+    return side_effect
+
+
+@pytest.fixture(scope="module")
+def default_engine() -> WorkflowEngine:
+    """A default-configured engine shared by the module.
+
+    WorkflowEngine only stores its settings; all per-call state lives
+    inside ``run_gsd_command``, so one instance can serve every test.
+    """
+    return WorkflowEngine()
 
 
 # ── Prompt construction tests ────────────────────────────────────
@@ -23,21 +66,17 @@ class TestPromptConstruction:
     """WorkflowEngine constructs the correct prompt string per command."""
 
     @pytest.mark.anyio
-    async def test_basic_command_prompt(self) -> None:
+    async def test_basic_command_prompt(self, default_engine) -> None:
         """Command name is prefixed with / in the prompt."""
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
+        engine = default_engine
 
         captured: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured["prompt"] = prompt
-            from openclawpack.output.schema import CommandResult
+            return _DEFAULT_OK
 
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command("gsd:new-project")
@@ -45,21 +84,17 @@ class TestPromptConstruction:
         assert captured["prompt"] == "/gsd:new-project"
 
     @pytest.mark.anyio
-    async def test_command_with_prompt_args(self) -> None:
+    async def test_command_with_prompt_args(self, default_engine) -> None:
         """prompt_args are appended after a space."""
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
+        engine = default_engine
 
         captured: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured["prompt"] = prompt
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
+            return _DEFAULT_OK
 
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command("gsd:plan-phase", prompt_args="3")
@@ -67,21 +102,17 @@ class TestPromptConstruction:
         assert captured["prompt"] == "/gsd:plan-phase 3"
 
     @pytest.mark.anyio
-    async def test_prompt_override(self) -> None:
+    async def test_prompt_override(self, default_engine) -> None:
         """prompt_override replaces the constructed prompt entirely."""
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
+        engine = default_engine
 
         captured: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured["prompt"] = prompt
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
+            return _DEFAULT_OK
 
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command(
@@ -95,165 +126,68 @@ class TestPromptConstruction:
 # ── Timeout tests ────────────────────────────────────────────────
 
 
+@patch.object(client_mod, "ClaudeTransport")
 class TestTimeoutSelection:
     """WorkflowEngine selects the correct default timeout per command."""
 
     @pytest.mark.anyio
-    async def test_new_project_default_timeout(self) -> None:
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
-
-        captured_config = {}
-
-        async def mock_run(prompt, **kwargs):
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
-            def capture_init(config):
-                captured_config["timeout"] = config.timeout_seconds
-                mock_instance = MagicMock()
-                mock_instance.run = mock_run
-                return mock_instance
-
-            MockTransport.side_effect = capture_init
-            await engine.run_gsd_command("gsd:new-project")
-
-        assert captured_config["timeout"] == 900
-
-    @pytest.mark.anyio
-    async def test_execute_phase_default_timeout(self) -> None:
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
-
-        captured_config = {}
-
-        async def mock_run(prompt, **kwargs):
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
-            def capture_init(config):
-                captured_config["timeout"] = config.timeout_seconds
-                mock_instance = MagicMock()
-                mock_instance.run = mock_run
-                return mock_instance
-
-            MockTransport.side_effect = capture_init
-            await engine.run_gsd_command("gsd:execute-phase")
-
-        assert captured_config["timeout"] == 1200
-
-    @pytest.mark.anyio
-    async def test_custom_timeout_overrides_default(self) -> None:
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine(timeout=42)
-
-        captured_config = {}
-
-        async def mock_run(prompt, **kwargs):
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
-            def capture_init(config):
-                captured_config["timeout"] = config.timeout_seconds
-                mock_instance = MagicMock()
-                mock_instance.run = mock_run
-                return mock_instance
-
-            MockTransport.side_effect = capture_init
-            await engine.run_gsd_command("gsd:new-project")
-
-        assert captured_config["timeout"] == 42
-
-    @pytest.mark.anyio
-    async def test_unknown_command_uses_600_default(self) -> None:
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
-
-        captured_config = {}
-
-        async def mock_run(prompt, **kwargs):
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
-            def capture_init(config):
-                captured_config["timeout"] = config.timeout_seconds
-                mock_instance = MagicMock()
-                mock_instance.run = mock_run
-                return mock_instance
-
-            MockTransport.side_effect = capture_init
-            await engine.run_gsd_command("gsd:unknown-command")
-
-        assert captured_config["timeout"] == 600
+    @pytest.mark.parametrize(
+        "engine_kwargs, command, expected",
+        [
+            ({}, "gsd:new-project", 900),
+            ({}, "gsd:execute-phase", 1200),
+            ({"timeout": 42}, "gsd:new-project", 42),
+            ({}, "gsd:unknown-command", 600),
+        ],
+        ids=[
+            "new_project_default",
+            "execute_phase_default",
+            "custom_overrides_default",
+            "unknown_command_600",
+        ],
+    )
+    async def test_timeout_selection(
+        self,
+        MockTransport: MagicMock,
+        engine_kwargs: dict,
+        command: str,
+        expected: int,
+    ) -> None:
+        engine = WorkflowEngine(**engine_kwargs)
+
+        captured_config: dict = {}
+        MockTransport.side_effect = _capturing_transport(captured_config)
+        await engine.run_gsd_command(command)
+
+        assert captured_config["timeout_seconds"] == expected
 
 
 # ── Config propagation tests ─────────────────────────────────────
 
 
+@patch.object(client_mod, "ClaudeTransport")
 class TestConfigPropagation:
     """WorkflowEngine propagates project_dir and system_prompt correctly."""
 
     @pytest.mark.anyio
-    async def test_project_dir_becomes_cwd(self) -> None:
-        from openclawpack.commands.engine import WorkflowEngine
-
+    async def test_project_dir_becomes_cwd(self, MockTransport: MagicMock) -> None:
         engine = WorkflowEngine(project_dir="/my/project")
 
-        captured_config = {}
-
-        async def mock_run(prompt, **kwargs):
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
-            def capture_init(config):
-                captured_config["cwd"] = config.cwd
-                captured_config["system_prompt"] = config.system_prompt
-                captured_config["setting_sources"] = config.setting_sources
-                mock_instance = MagicMock()
-                mock_instance.run = mock_run
-                return mock_instance
-
-            MockTransport.side_effect = capture_init
-            await engine.run_gsd_command("gsd:new-project")
+        captured_config: dict = {}
+        MockTransport.side_effect = _capturing_transport(captured_config)
+        await engine.run_gsd_command("gsd:new-project")
 
         assert captured_config["cwd"] == "/my/project"
 
     @pytest.mark.anyio
-    async def test_system_prompt_is_preset_dict(self) -> None:
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
-
-        captured_config = {}
+    async def test_system_prompt_is_preset_dict(
+        self, MockTransport: MagicMock, default_engine
+    ) -> None:
+        engine = default_engine
 
-        async def mock_run(prompt, **kwargs):
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
-            def capture_init(config):
-                captured_config["system_prompt"] = config.system_prompt
-                mock_instance = MagicMock()
-                mock_instance.run = mock_run
-                return mock_instance
-
-            MockTransport.side_effect = capture_init
-            await engine.run_gsd_command("gsd:new-project")
+        captured_config: dict = {}
+        MockTransport.side_effect = _capturing_transport(captured_config)
+        await engine.run_gsd_command("gsd:new-project")
 
         sp = captured_config["system_prompt"]
         assert isinstance(sp, dict)
@@ -262,27 +196,14 @@ class TestConfigPropagation:
         assert "non-interactively" in sp["append"]
 
     @pytest.mark.anyio
-    async def test_setting_sources_is_project(self) -> None:
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
+    async def test_setting_sources_is_project(
+        self, MockTransport: MagicMock, default_engine
+    ) -> None:
+        engine = default_engine
 
-        captured_config = {}
-
-        async def mock_run(prompt, **kwargs):
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
-            def capture_init(config):
-                captured_config["setting_sources"] = config.setting_sources
-                mock_instance = MagicMock()
-                mock_instance.run = mock_run
-                return mock_instance
-
-            MockTransport.side_effect = capture_init
-            await engine.run_gsd_command("gsd:new-project")
+        captured_config: dict = {}
+        MockTransport.side_effect = _capturing_transport(captured_config)
+        await engine.run_gsd_command("gsd:new-project")
 
         assert captured_config["setting_sources"] == ["project"]
 
@@ -294,21 +215,17 @@ class TestAnswerMapWiring:
     """WorkflowEngine wires answer_map to can_use_tool callback."""
 
     @pytest.mark.anyio
-    async def test_answer_map_creates_callback(self) -> None:
+    async def test_answer_map_creates_callback(self, default_engine) -> None:
         """When answer_map provided, can_use_tool and hooks are passed to run()."""
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
+        engine = default_engine
 
         captured_kwargs: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured_kwargs.update(kwargs)
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
+            return _DEFAULT_OK
 
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command(
@@ -322,21 +239,17 @@ class TestAnswerMapWiring:
         assert "PreToolUse" in captured_kwargs["hooks"]
 
     @pytest.mark.anyio
-    async def test_no_answer_map_no_callback(self) -> None:
+    async def test_no_answer_map_no_callback(self, default_engine) -> None:
         """When answer_map is None, no can_use_tool or hooks are passed."""
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
+        engine = default_engine
 
         captured_kwargs: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured_kwargs.update(kwargs)
-            from openclawpack.output.schema import CommandResult
+            return _DEFAULT_OK
 
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command("gsd:new-project")
@@ -345,23 +258,21 @@ class TestAnswerMapWiring:
         assert "hooks" not in captured_kwargs
 
     @pytest.mark.anyio
-    async def test_answer_map_uses_hooks_dict_with_hookmatcher(self) -> None:
+    async def test_answer_map_uses_hooks_dict_with_hookmatcher(
+        self, default_engine
+    ) -> None:
         """When answer_map provided, hooks contain HookMatcher objects."""
         from claude_agent_sdk import HookMatcher
 
-        from openclawpack.commands.engine import WorkflowEngine
-
-        engine = WorkflowEngine()
+        engine = default_engine
 
         captured_kwargs: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured_kwargs.update(kwargs)
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
+            return _DEFAULT_OK
 
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command(
@@ -384,19 +295,15 @@ class TestVerboseQuietForwarding:
     @pytest.mark.anyio
     async def test_verbose_forwarded_to_transport_run(self) -> None:
         """verbose=True on engine passes verbose=True to run() kwargs."""
-        from openclawpack.commands.engine import WorkflowEngine
-
         engine = WorkflowEngine(verbose=True)
 
         captured_kwargs: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured_kwargs.update(kwargs)
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
+            return _DEFAULT_OK
 
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command("gsd:new-project")
@@ -406,19 +313,15 @@ class TestVerboseQuietForwarding:
     @pytest.mark.anyio
     async def test_verbose_not_forwarded_when_false(self) -> None:
         """verbose=False on engine does not pass verbose kwarg."""
-        from openclawpack.commands.engine import WorkflowEngine
-
         engine = WorkflowEngine(verbose=False)
 
         captured_kwargs: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured_kwargs.update(kwargs)
-            from openclawpack.output.schema import CommandResult
+            return _DEFAULT_OK
 
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command("gsd:new-project")
@@ -428,19 +331,15 @@ class TestVerboseQuietForwarding:
     @pytest.mark.anyio
     async def test_quiet_forwarded_to_transport_run(self) -> None:
         """quiet=True on engine passes quiet=True to run() kwargs."""
-        from openclawpack.commands.engine import WorkflowEngine
-
         engine = WorkflowEngine(quiet=True)
 
         captured_kwargs: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured_kwargs.update(kwargs)
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
+            return _DEFAULT_OK
 
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command("gsd:new-project")
@@ -450,19 +349,15 @@ class TestVerboseQuietForwarding:
     @pytest.mark.anyio
     async def test_quiet_not_forwarded_when_false(self) -> None:
         """quiet=False on engine does not pass quiet kwarg."""
-        from openclawpack.commands.engine import WorkflowEngine
-
         engine = WorkflowEngine(quiet=False)
 
         captured_kwargs: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured_kwargs.update(kwargs)
-            from openclawpack.output.schema import CommandResult
-
-            return CommandResult.ok(result="done")
+            return _DEFAULT_OK
 
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command("gsd:new-project")
@@ -472,19 +367,15 @@ class TestVerboseQuietForwarding:
     @pytest.mark.anyio
     async def test_quiet_takes_precedence_over_verbose(self) -> None:
         """When both quiet and verbose are set, quiet wins."""
-        from openclawpack.commands.engine import WorkflowEngine
-
         engine = WorkflowEngine(quiet=True, verbose=True)
 
         captured_kwargs: dict = {}
 
         async def mock_run(prompt, **kwargs):
             captured_kwargs.update(kwargs)
-            from openclawpack.output.schema import CommandResult
+            return _DEFAULT_OK
 
-            return CommandResult.ok(result="done")
-
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             await engine.run_gsd_command("gsd:new-project")
@@ -500,18 +391,18 @@ class TestTransportErrorHandling:
     """WorkflowEngine catches TransportError and returns CommandResult.error()."""
 
     @pytest.mark.anyio
-    async def test_transport_error_returns_command_result_error(self) -> None:
+    async def test_transport_error_returns_command_result_error(
+        self, default_engine
+    ) -> None:
         """CLINotFound raised by transport is caught and wrapped."""
-        from openclawpack.commands.engine import WorkflowEngine
-        from openclawpack.output.schema import CommandResult
         from openclawpack.transport.errors import CLINotFound
 
-        engine = WorkflowEngine()
+        engine = default_engine
 
         async def mock_run(prompt, **kwargs):
             raise CLINotFound("Claude Code CLI not found")
 
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             result = await engine.run_gsd_command("gsd:new-project")
@@ -521,18 +412,16 @@ class TestTransportErrorHandling:
         assert "CLI not found" in result.errors[0]
 
     @pytest.mark.anyio
-    async def test_transport_timeout_returns_error(self) -> None:
+    async def test_transport_timeout_returns_error(self, default_engine) -> None:
         """TransportTimeout is caught and wrapped."""
-        from openclawpack.commands.engine import WorkflowEngine
-        from openclawpack.output.schema import CommandResult
         from openclawpack.transport.errors import TransportTimeout
 
-        engine = WorkflowEngine()
+        engine = default_engine
 
         async def mock_run(prompt, **kwargs):
             raise TransportTimeout("timed out after 300s", timeout_seconds=300)
 
-        with patch(_TRANSPORT_PATCH) as MockTransport:
+        with patch.object(client_mod, "ClaudeTransport") as MockTransport:
             instance = MockTransport.return_value
             instance.run = mock_run
             result = await engine.run_gsd_command("gsd:new-project")
@@ -548,11 +437,13 @@ class TestTransportErrorHandling:
 class TestDefaultTimeouts:
     """DEFAULT_TIMEOUTS dict has expected entries."""
 
-    def test_new_project_timeout(self) -> None:
-        assert DEFAULT_TIMEOUTS["gsd:new-project"] == 900
-
-    def test_plan_phase_timeout(self) -> None:
-        assert DEFAULT_TIMEOUTS["gsd:plan-phase"] == 600
-
-    def test_execute_phase_timeout(self) -> None:
-        assert DEFAULT_TIMEOUTS["gsd:execute-phase"] == 1200
+    @pytest.mark.parametrize(
+        "command, timeout",
+        [
+            ("gsd:new-project", 900),
+            ("gsd:plan-phase", 600),
+            ("gsd:execute-phase", 1200),
+        ],
+    )
+    def test_default_timeouts(self, command: str, timeout: int) -> None:
+        assert DEFAULT_TIMEOUTS[command] == timeout
@@ -7,17 +7,37 @@ WorkflowEngine at its source module: ``openclawpack.commands.engine``.
 
 from __future__ import annotations
 
+import functools
 from unittest.mock import AsyncMock, patch
 
+import anyio
 import pytest
 
+import openclawpack.commands.engine as engine_mod
 from openclawpack.commands.execute_phase import (
     EXECUTE_PHASE_DEFAULTS,
     execute_phase_workflow,
 )
+from openclawpack.output.schema import CommandResult
 
-_ENGINE_CLS_PATCH = "openclawpack.commands.engine.WorkflowEngine"
-_ENGINE_RUN_PATCH = "openclawpack.commands.engine.WorkflowEngine.run_gsd_command"
+# Safe to share: execute_phase_workflow returns the engine result as-is.
+_OK_EXECUTED = CommandResult.ok(result="executed")
+
+
+class _AsyncSpy:
+    """Awaitable stand-in for run_gsd_command that records its last call."""
+
+    def __init__(self, ret: CommandResult = _OK_EXECUTED) -> None:
+        self.ret = ret
+        self.calls = 0
+        self.args: tuple = ()
+        self.kwargs: dict = {}
+
+    async def __call__(self, *args, **kwargs) -> CommandResult:
+        self.args = args
+        self.kwargs = kwargs
+        self.calls += 1
+        return self.ret
 
 
 # ── Prompt construction ─────────────────────────────────────────
@@ -29,31 +49,24 @@ class TestPromptConstruction:
     @pytest.mark.anyio
     async def test_execute_phase_prompt_construction(self) -> None:
         """Prompt is /gsd:execute-phase <N> for given phase number."""
-        mock_run = AsyncMock()
-        from openclawpack.output.schema import CommandResult
+        mock_run = _AsyncSpy()
 
-        mock_run.return_value = CommandResult.ok(result="executed")
-
-        with patch(_ENGINE_RUN_PATCH, mock_run):
+        with patch.object(engine_mod.WorkflowEngine, "run_gsd_command", mock_run):
             await execute_phase_workflow(phase=2)
 
-        mock_run.assert_called_once()
-        call_kwargs = mock_run.call_args
-        assert call_kwargs.args[0] == "gsd:execute-phase"
-        assert call_kwargs.kwargs["prompt_args"] == "2"
+        assert mock_run.calls == 1
+        assert mock_run.args[0] == "gsd:execute-phase"
+        assert mock_run.kwargs["prompt_args"] == "2"
 
     @pytest.mark.anyio
     async def test_execute_phase_prompt_different_phase(self) -> None:
         """Phase number is converted to string in prompt_args."""
-        mock_run = AsyncMock()
-        from openclawpack.output.schema import CommandResult
-
-        mock_run.return_value = CommandResult.ok(result="executed")
+        mock_run = _AsyncSpy()
 
-        with patch(_ENGINE_RUN_PATCH, mock_run):
+        with patch.object(engine_mod.WorkflowEngine, "run_gsd_command", mock_run):
             await execute_phase_workflow(phase=3)
 
-        assert mock_run.call_args.kwargs["prompt_args"] == "3"
+        assert mock_run.kwargs["prompt_args"] == "3"
 
 
 # ── Timeout tests ───────────────────────────────────────────────
@@ -65,12 +78,9 @@ class TestTimeout:
     @pytest.mark.anyio
     async def test_execute_phase_default_timeout(self) -> None:
         """Default timeout is 1200s for execute-phase (longer for subagent waves)."""
-        mock_run = AsyncMock()
-        from openclawpack.output.schema import CommandResult
-
-        mock_run.return_value = CommandResult.ok(result="executed")
+        mock_run = _AsyncSpy()
 
-        with patch(_ENGINE_CLS_PATCH) as MockEngine:
+        with patch.object(engine_mod, "WorkflowEngine") as MockEngine:
             mock_instance = MockEngine.return_value
             mock_instance.run_gsd_command = mock_run
             await execute_phase_workflow(phase=1)
@@ -81,12 +91,9 @@ class TestTimeout:
     @pytest.mark.anyio
     async def test_execute_phase_custom_timeout(self) -> None:
         """Custom timeout overrides the 1200s default."""
-        mock_run = AsyncMock()
-        from openclawpack.output.schema import CommandResult
+        mock_run = _AsyncSpy()
 
-        mock_run.return_value = CommandResult.ok(result="executed")
-
-        with patch(_ENGINE_CLS_PATCH) as MockEngine:
+        with patch.object(engine_mod, "WorkflowEngine") as MockEngine:
             mock_instance = MockEngine.return_value
             mock_instance.run_gsd_command = mock_run
             await execute_phase_workflow(phase=1, timeout=500)
@@ -97,41 +104,38 @@ class TestTimeout:
 # ── Answer map tests ────────────────────────────────────────────
 
 
-class TestAnswerMap:
-    """execute_phase_workflow builds and passes the correct answer map."""
+@pytest.fixture(scope="module")
+def default_answer_map() -> dict:
+    """Run the workflow once with no overrides and capture its answer_map."""
+    mock_run = _AsyncSpy()
 
-    @pytest.mark.anyio
-    async def test_execute_phase_default_answers(self) -> None:
-        """EXECUTE_PHASE_DEFAULTS are passed as the answer_map."""
-        mock_run = AsyncMock()
-        from openclawpack.output.schema import CommandResult
+    with patch.object(engine_mod.WorkflowEngine, "run_gsd_command", mock_run):
+        anyio.run(functools.partial(execute_phase_workflow, phase=1))
 
-        mock_run.return_value = CommandResult.ok(result="executed")
+    return mock_run.kwargs["answer_map"]
 
-        with patch(_ENGINE_RUN_PATCH, mock_run):
-            await execute_phase_workflow(phase=1)
 
-        call_kwargs = mock_run.call_args.kwargs
-        answer_map = call_kwargs["answer_map"]
+class TestAnswerMap:
+    """execute_phase_workflow builds and passes the correct answer map."""
+
+    def test_execute_phase_default_answers(self, default_answer_map: dict) -> None:
+        """EXECUTE_PHASE_DEFAULTS are passed as the answer_map."""
+        answer_map = default_answer_map
         for key, value in EXECUTE_PHASE_DEFAULTS.items():
             assert answer_map[key] == value
 
     @pytest.mark.anyio
     async def test_execute_phase_answer_overrides(self) -> None:
         """answer_overrides merge on top of defaults."""
-        mock_run = AsyncMock()
-        from openclawpack.output.schema import CommandResult
-
-        mock_run.return_value = CommandResult.ok(result="executed")
+        mock_run = _AsyncSpy()
 
-        with patch(_ENGINE_RUN_PATCH, mock_run):
+        with patch.object(engine_mod.WorkflowEngine, "run_gsd_command", mock_run):
             await execute_phase_workflow(
                 phase=1,
                 answer_overrides={"approve": "rejected", "custom": "value"},
             )
 
-        call_kwargs = mock_run.call_args.kwargs
-        answer_map = call_kwargs["answer_map"]
+        answer_map = mock_run.kwargs["answer_map"]
         # Override replaces default
         assert answer_map["approve"] == "rejected"
         # Other defaults preserved
@@ -139,19 +143,9 @@ class TestAnswerMap:
         # Custom key added
         assert answer_map["custom"] == "value"
 
-    @pytest.mark.anyio
-    async def test_execute_phase_checkpoint_answers(self) -> None:
+    def test_execute_phase_checkpoint_answers(self, default_answer_map: dict) -> None:
         """Answer map contains entries for key checkpoint-related question patterns."""
-        mock_run = AsyncMock()
-        from openclawpack.output.schema import CommandResult
-
-        mock_run.return_value = CommandResult.ok(result="executed")
-
-        with patch(_ENGINE_RUN_PATCH, mock_run):
-            await execute_phase_workflow(phase=1)
-
-        call_kwargs = mock_run.call_args.kwargs
-        answer_map = call_kwargs["answer_map"]
+        answer_map = default_answer_map
         # Key checkpoint-related answer entries must be present
         assert "approve" in answer_map
         assert "checkpoint" in answer_map
@@ -167,12 +161,9 @@ class TestProjectDirPropagation:
     @pytest.mark.anyio
     async def test_execute_phase_project_dir_propagation(self) -> None:
         """project_dir is forwarded to WorkflowEngine constructor."""
-        mock_run = AsyncMock()
-        from openclawpack.output.schema import CommandResult
-
-        mock_run.return_value = CommandResult.ok(result="executed")
+        mock_run = _AsyncSpy()
 
-        with patch(_ENGINE_CLS_PATCH) as MockEngine:
+        with patch.object(engine_mod, "WorkflowEngine") as MockEngine:
             mock_instance = MockEngine.return_value
             mock_instance.run_gsd_command = mock_run
             await execute_phase_workflow(phase=1, project_dir="/my/project")
@@ -182,12 +173,9 @@ class TestProjectDirPropagation:
     @pytest.mark.anyio
     async def test_execute_phase_verbose_quiet_propagation(self) -> None:
         """verbose and quiet flags are forwarded to WorkflowEngine."""
-        mock_run = AsyncMock()
-        from openclawpack.output.schema import CommandResult
-
-        mock_run.return_value = CommandResult.ok(result="executed")
+        mock_run = _AsyncSpy()
 
-        with patch(_ENGINE_CLS_PATCH) as MockEngine:
+        with patch.object(engine_mod, "WorkflowEngine") as MockEngine:
             mock_instance = MockEngine.return_value
             mock_instance.run_gsd_command = mock_run
             await execute_phase_workflow(phase=1, verbose=True, quiet=True)
@@ -207,9 +195,8 @@ class TestExecutePhaseErrorHandling:
     async def test_workflow_returns_error_on_failure(self) -> None:
         """Exception during workflow returns CommandResult.error(), not traceback."""
         mock_run = AsyncMock(side_effect=Exception("Transport failed"))
-        from openclawpack.output.schema import CommandResult
 
-        with patch(_ENGINE_CLS_PATCH) as MockEngine:
+        with patch.object(engine_mod, "WorkflowEngine") as MockEngine:
             mock_instance = MockEngine.return_value
             mock_instance.run_gsd_command = mock_run
             result = await execute_phase_workflow(phase=1)
@@ -6,20 +6,19 @@ NOTE: WorkflowEngine is imported lazily inside the function body, so we
 patch at the source module (openclawpack.commands.engine.WorkflowEngine).
 """
 
-import tempfile
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+import openclawpack.commands.engine as engine_mod
 from openclawpack.commands.new_project import (
     NEW_PROJECT_DEFAULTS,
     new_project_workflow,
 )
 from openclawpack.output.schema import CommandResult
 
-# Patch target for WorkflowEngine (source module, not consumer module)
-_ENGINE_PATCH = "openclawpack.commands.engine.WorkflowEngine"
+# Reused by every mock engine; new_project_workflow never mutates it.
+_OK_CREATED = CommandResult.ok(result={"status": "created"}, duration_ms=100)
 
 
 # ── Helper ───────────────────────────────────────────────────────
@@ -28,87 +27,94 @@ _ENGINE_PATCH = "openclawpack.commands.engine.WorkflowEngine"
 def _make_mock_engine() -> MagicMock:
     """Create a mock WorkflowEngine whose run_gsd_command returns a CommandResult."""
     engine = MagicMock()
-    engine.run_gsd_command = AsyncMock(
-        return_value=CommandResult.ok(result={"status": "created"}, duration_ms=100)
-    )
+    engine.run_gsd_command = AsyncMock(return_value=_OK_CREATED)
     return engine
 
 
+_SESSION_ENGINE = _make_mock_engine()
+
+
+@pytest.fixture
+def mock_engine() -> MagicMock:
+    """The shared mock engine, with call history cleared for this test."""
+    _SESSION_ENGINE.run_gsd_command.reset_mock()
+    _SESSION_ENGINE.run_gsd_command.return_value = _OK_CREATED
+    return _SESSION_ENGINE
+
+
+@pytest.fixture(scope="session")
+def idea_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write the sample idea file once per session and return its path."""
+    path = tmp_path_factory.mktemp("ideas") / "ml.txt"
+    path.write_text("A machine learning pipeline for image classification")
+    return str(path)
+
+
 # ── Tests ────────────────────────────────────────────────────────
 
 
 class TestNewProjectPrompt:
     @pytest.mark.anyio
-    async def test_prompt_construction(self):
+    async def test_prompt_construction(self, mock_engine):
         """Prompt starts with /gsd:new-project --auto and contains the idea."""
-        engine = _make_mock_engine()
-        with patch(_ENGINE_PATCH, return_value=engine):
+        engine = mock_engine
+        with patch.object(engine_mod, "WorkflowEngine", return_value=engine):
             await new_project_workflow(idea="build a todo app")
             engine.run_gsd_command.assert_called_once()
-            call_kwargs = engine.run_gsd_command.call_args
-            prompt = call_kwargs.kwargs.get("prompt_override")
+            kwargs = engine.run_gsd_command.call_args.kwargs
+            prompt = kwargs["prompt_override"]
             assert prompt is not None
             assert prompt.startswith("/gsd:new-project --auto")
             assert "build a todo app" in prompt
 
     @pytest.mark.anyio
-    async def test_reads_idea_file(self):
+    async def test_reads_idea_file(self, mock_engine, idea_file: str):
         """If idea is a file path, its content is used in the prompt."""
-        engine = _make_mock_engine()
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write("A machine learning pipeline for image classification")
-            f.flush()
-            idea_file = f.name
-
-        try:
-            with patch(_ENGINE_PATCH, return_value=engine):
-                await new_project_workflow(idea=idea_file)
-                call_kwargs = engine.run_gsd_command.call_args
-                prompt = call_kwargs.kwargs.get("prompt_override")
-                assert "machine learning pipeline" in prompt
-                # Original file path should NOT be in the prompt
-                assert idea_file not in prompt
-        finally:
-            Path(idea_file).unlink(missing_ok=True)
+        engine = mock_engine
+        with patch.object(engine_mod, "WorkflowEngine", return_value=engine):
+            await new_project_workflow(idea=idea_file)
+            kwargs = engine.run_gsd_command.call_args.kwargs
+            prompt = kwargs["prompt_override"]
+            assert "machine learning pipeline" in prompt
+            # Original file path should NOT be in the prompt
+            assert idea_file not in prompt
 
     @pytest.mark.anyio
-    async def test_plain_text_idea(self):
+    async def test_plain_text_idea(self, mock_engine):
         """Plain text that isn't a file path is used directly."""
-        engine = _make_mock_engine()
-        with patch(_ENGINE_PATCH, return_value=engine):
+        engine = mock_engine
+        with patch.object(engine_mod, "WorkflowEngine", return_value=engine):
             await new_project_workflow(idea="build a REST API for user management")
-            call_kwargs = engine.run_gsd_command.call_args
-            prompt = call_kwargs.kwargs.get("prompt_override")
+            kwargs = engine.run_gsd_command.call_args.kwargs
+            prompt = kwargs["prompt_override"]
             assert "REST API for user management" in prompt
 
 
 class TestNewProjectAnswerMap:
     @pytest.mark.anyio
-    async def test_default_answers(self):
+    async def test_default_answers(self, mock_engine):
         """NEW_PROJECT_DEFAULTS is used when no overrides provided."""
-        engine = _make_mock_engine()
-        with patch(_ENGINE_PATCH, return_value=engine):
+        engine = mock_engine
+        with patch.object(engine_mod, "WorkflowEngine", return_value=engine):
             await new_project_workflow(idea="test project")
-            call_kwargs = engine.run_gsd_command.call_args
-            answer_map = call_kwargs.kwargs.get("answer_map")
+            kwargs = engine.run_gsd_command.call_args.kwargs
+            answer_map = kwargs["answer_map"]
             assert answer_map is not None
             # Should contain all defaults
             for key, value in NEW_PROJECT_DEFAULTS.items():
                 assert answer_map[key] == value
 
     @pytest.mark.anyio
-    async def test_answer_overrides(self):
+    async def test_answer_overrides(self, mock_engine):
         """answer_overrides merge with and override defaults."""
-        engine = _make_mock_engine()
+        engine = mock_engine
         overrides = {"depth": "5", "custom_key": "custom_value"}
-        with patch(_ENGINE_PATCH, return_value=engine):
+        with patch.object(engine_mod, "WorkflowEngine", return_value=engine):
             await new_project_workflow(
                 idea="test project", answer_overrides=overrides
             )
-            call_kwargs = engine.run_gsd_command.call_args
-            answer_map = call_kwargs.kwargs.get("answer_map")
+            kwargs = engine.run_gsd_command.call_args.kwargs
+            answer_map = kwargs["answer_map"]
             # Overridden value
             assert answer_map["depth"] == "5"
             # New key from overrides
@@ -124,69 +130,69 @@ class TestNewProjectAnswerMap:
 
 class TestNewProjectEngineConfig:
     @pytest.mark.anyio
-    async def test_timeout_passed_to_engine(self):
+    async def test_timeout_passed_to_engine(self, mock_engine):
         """Custom timeout is passed to the WorkflowEngine."""
-        engine_cls = MagicMock(return_value=_make_mock_engine())
-        with patch(_ENGINE_PATCH, engine_cls):
+        engine_cls = MagicMock(return_value=mock_engine)
+        with patch.object(engine_mod, "WorkflowEngine", engine_cls):
             await new_project_workflow(idea="test project", timeout=1200.0)
-            init_kwargs = engine_cls.call_args
-            assert init_kwargs.kwargs.get("timeout") == 1200.0
+            init_kwargs = engine_cls.call_args.kwargs
+            assert init_kwargs["timeout"] == 1200.0
 
     @pytest.mark.anyio
-    async def test_project_dir_propagation(self):
+    async def test_project_dir_propagation(self, mock_engine):
         """project_dir is passed to the WorkflowEngine."""
-        engine_cls = MagicMock(return_value=_make_mock_engine())
-        with patch(_ENGINE_PATCH, engine_cls):
+        engine_cls = MagicMock(return_value=mock_engine)
+        with patch.object(engine_mod, "WorkflowEngine", engine_cls):
             await new_project_workflow(
                 idea="test project", project_dir="/custom/path"
             )
-            init_kwargs = engine_cls.call_args
-            assert init_kwargs.kwargs.get("project_dir") == "/custom/path"
+            init_kwargs = engine_cls.call_args.kwargs
+            assert init_kwargs["project_dir"] == "/custom/path"
 
     @pytest.mark.anyio
-    async def test_verbose_propagation(self):
+    async def test_verbose_propagation(self, mock_engine):
         """verbose flag is passed to the WorkflowEngine."""
-        engine_cls = MagicMock(return_value=_make_mock_engine())
-        with patch(_ENGINE_PATCH, engine_cls):
+        engine_cls = MagicMock(return_value=mock_engine)
+        with patch.object(engine_mod, "WorkflowEngine", engine_cls):
             await new_project_workflow(idea="test project", verbose=True)
-            init_kwargs = engine_cls.call_args
-            assert init_kwargs.kwargs.get("verbose") is True
+            init_kwargs = engine_cls.call_args.kwargs
+            assert init_kwargs["verbose"] is True
 
     @pytest.mark.anyio
-    async def test_quiet_propagation(self):
+    async def test_quiet_propagation(self, mock_engine):
         """quiet flag is passed to the WorkflowEngine."""
-        engine_cls = MagicMock(return_value=_make_mock_engine())
-        with patch(_ENGINE_PATCH, engine_cls):
+        engine_cls = MagicMock(return_value=mock_engine)
+        with patch.object(engine_mod, "WorkflowEngine", engine_cls):
             await new_project_workflow(idea="test project", quiet=True)
-            init_kwargs = engine_cls.call_args
-            assert init_kwargs.kwargs.get("quiet") is True
+            init_kwargs = engine_cls.call_args.kwargs
+            assert init_kwargs["quiet"] is True
 
     @pytest.mark.anyio
-    async def test_default_project_dir_is_cwd(self):
+    async def test_default_project_dir_is_cwd(self, mock_engine):
         """When project_dir is None, os.getcwd() is used."""
-        engine_cls = MagicMock(return_value=_make_mock_engine())
-        with patch(_ENGINE_PATCH, engine_cls), patch(
+        engine_cls = MagicMock(return_value=mock_engine)
+        with patch.object(engine_mod, "WorkflowEngine", engine_cls), patch(
             "openclawpack.commands.new_project.os.getcwd",
             return_value="/mocked/cwd",
         ):
             await new_project_workflow(idea="test project", project_dir=None)
-            init_kwargs = engine_cls.call_args
-            assert init_kwargs.kwargs.get("project_dir") == "/mocked/cwd"
+            init_kwargs = engine_cls.call_args.kwargs
+            assert init_kwargs["project_dir"] == "/mocked/cwd"
 
     @pytest.mark.anyio
-    async def test_gsd_command_is_new_project(self):
+    async def test_gsd_command_is_new_project(self, mock_engine):
         """The engine receives 'gsd:new-project' as the command."""
-        engine = _make_mock_engine()
-        with patch(_ENGINE_PATCH, return_value=engine):
+        engine = mock_engine
+        with patch.object(engine_mod, "WorkflowEngine", return_value=engine):
             await new_project_workflow(idea="test project")
-            call_args = engine.run_gsd_command.call_args
-            assert call_args[0][0] == "gsd:new-project"
+            args = engine.run_gsd_command.call_args.args
+            assert args[0] == "gsd:new-project"
 
     @pytest.mark.anyio
-    async def test_returns_command_result(self):
+    async def test_returns_command_result(self, mock_engine):
         """The workflow returns a CommandResult from the engine."""
-        engine = _make_mock_engine()
-        with patch(_ENGINE_PATCH, return_value=engine):
+        engine = mock_engine
+        with patch.object(engine_mod, "WorkflowEngine", return_value=engine):
             result = await new_project_workflow(idea="test project")
             assert isinstance(result, CommandResult)
             assert result.success is True
@@ -205,7 +211,7 @@ class TestNewProjectErrorHandling:
         engine.run_gsd_command = AsyncMock(
             side_effect=Exception("Transport failed")
         )
-        with patch(_ENGINE_PATCH, return_value=engine):
+        with patch.object(engine_mod, "WorkflowEngine", return_value=engine):
             result = await new_project_workflow(idea="test idea")
 
         assert isinstance(result, CommandResult)
@@ -7,8 +7,10 @@ using a temporary registry file and mock project directories.
 from __future__ import annotations
 
 import json
+import os
+import shutil
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 from typer.testing import CliRunner
@@ -17,6 +19,12 @@ from openclawpack.cli import app
 
 runner = CliRunner()
 
+# Minimal STATE.md for get_project_summary
+_STATE_MD = (
+    b"# Project State\n\n## Current Position\nPhase: 1 of 1 (Foundation)\n"
+)
+_PROJECT_MD = b"# Test Project\n\nDescription: test\n"
+
 
 # ── Helpers ──────────────────────────────────────────────────────
 
@@ -26,13 +34,8 @@ def _make_gsd_project(tmp_path: Path, name: str = "myproject") -> Path:
     project_dir = tmp_path / name
     project_dir.mkdir(parents=True, exist_ok=True)
     (project_dir / ".planning").mkdir(exist_ok=True)
-    # Minimal STATE.md for get_project_summary
-    (project_dir / ".planning" / "STATE.md").write_text(
-        "# Project State\n\n## Current Position\nPhase: 1 of 1 (Foundation)\n"
-    )
-    (project_dir / ".planning" / "PROJECT.md").write_text(
-        "# Test Project\n\nDescription: test\n"
-    )
+    (project_dir / ".planning" / "STATE.md").write_bytes(_STATE_MD)
+    (project_dir / ".planning" / "PROJECT.md").write_bytes(_PROJECT_MD)
     return project_dir
 
 
@@ -41,24 +44,69 @@ def _parse_output(result) -> dict:
     return json.loads(result.output)
 
 
+@pytest.fixture(scope="session")
+def _gsd_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A GSD project tree built once and copied into each test."""
+    return _make_gsd_project(tmp_path_factory.mktemp("template"))
+
+
+@pytest.fixture
+def make_gsd_project(
+    tmp_path: Path, _gsd_template: Path
+) -> Callable[..., Path]:
+    """Factory hardlinking the template project into ``tmp_path/<name>``.
+
+    The registry only reads project files, so linking is safe.
+    """
+
+    def _make(name: str = "myproject") -> Path:
+        return Path(
+            shutil.copytree(
+                _gsd_template,
+                tmp_path / name,
+                copy_function=os.link,
+                dirs_exist_ok=True,
+            )
+        )
+
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def _isolate_registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the registry's data directory at tmp_path for every test."""
+    monkeypatch.setattr(
+        "openclawpack.state.registry._user_data_dir", lambda: tmp_path
+    )
+
+
+@pytest.fixture
+def registered_project(make_gsd_project: Callable[..., Path]) -> Path:
+    """A GSD project already in the tmp_path registry.
+
+    Registers through ``ProjectRegistry`` directly so tests only invoke
+    the CLI for the subcommand under test.
+    """
+    from openclawpack.state.registry import ProjectRegistry
+
+    project_dir = make_gsd_project()
+    ProjectRegistry.load().add(project_dir)
+    return project_dir
+
+
 # ── Test Add ─────────────────────────────────────────────────────
 
 
 class TestProjectsAdd:
     """Tests for ``openclawpack projects add``."""
 
-    def test_add_success(self, tmp_path: Path) -> None:
+    def test_add_success(self, make_gsd_project: Callable[..., Path]) -> None:
         """Adding a valid GSD project directory registers it."""
-        project_dir = _make_gsd_project(tmp_path)
-        registry_path = tmp_path / "registry.json"
-
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            result = runner.invoke(
-                app, ["projects", "add", str(project_dir)]
-            )
+        project_dir = make_gsd_project()
+
+        result = runner.invoke(
+            app, ["projects", "add", str(project_dir)]
+        )
 
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         data = _parse_output(result)
@@ -66,18 +114,16 @@ class TestProjectsAdd:
         assert data["result"]["name"] == project_dir.name
         assert data["result"]["path"] == str(project_dir.resolve())
 
-    def test_add_with_custom_name(self, tmp_path: Path) -> None:
+    def test_add_with_custom_name(
+        self, make_gsd_project: Callable[..., Path]
+    ) -> None:
         """Adding with --name uses the provided name."""
-        project_dir = _make_gsd_project(tmp_path)
-
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            result = runner.invoke(
-                app,
-                ["projects", "add", str(project_dir), "--name", "custom"],
-            )
+        project_dir = make_gsd_project()
+
+        result = runner.invoke(
+            app,
+            ["projects", "add", str(project_dir), "--name", "custom"],
+        )
 
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         data = _parse_output(result)
@@ -86,13 +132,9 @@ class TestProjectsAdd:
 
     def test_add_nonexistent_path(self, tmp_path: Path) -> None:
         """Adding a nonexistent path returns an error."""
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            result = runner.invoke(
-                app, ["projects", "add", str(tmp_path / "nope")]
-            )
+        result = runner.invoke(
+            app, ["projects", "add", str(tmp_path / "nope")]
+        )
 
         assert result.exit_code == 0  # CLI exits 0, error in payload
         data = _parse_output(result)
@@ -104,38 +146,33 @@ class TestProjectsAdd:
         bare_dir = tmp_path / "bare"
         bare_dir.mkdir()
 
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            result = runner.invoke(
-                app, ["projects", "add", str(bare_dir)]
-            )
+        result = runner.invoke(
+            app, ["projects", "add", str(bare_dir)]
+        )
 
         assert result.exit_code == 0
         data = _parse_output(result)
         assert data["success"] is False
         assert ".planning" in data["errors"][0]
 
-    def test_add_duplicate_name(self, tmp_path: Path) -> None:
+    def test_add_duplicate_name(
+        self, make_gsd_project: Callable[..., Path]
+    ) -> None:
         """Adding a project with a name that already exists returns an error."""
-        project_dir = _make_gsd_project(tmp_path, "proj1")
-        project_dir2 = _make_gsd_project(tmp_path, "proj2")
-
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            # Add first
-            runner.invoke(
-                app,
-                ["projects", "add", str(project_dir), "--name", "shared"],
-            )
-            # Add second with same name
-            result = runner.invoke(
-                app,
-                ["projects", "add", str(project_dir2), "--name", "shared"],
-            )
+        project_dir = make_gsd_project("proj1")
+        project_dir2 = make_gsd_project("proj2")
+
+        # Add first
+        runner.invoke(
+            app,
+            ["projects", "add", str(project_dir), "--name", "shared"],
+            catch_exceptions=False,
+        )
+        # Add second with same name
+        result = runner.invoke(
+            app,
+            ["projects", "add", str(project_dir2), "--name", "shared"],
+        )
 
         data = _parse_output(result)
         assert data["success"] is False
@@ -148,16 +185,11 @@ class TestProjectsAdd:
 class TestProjectsList:
     """Tests for ``openclawpack projects list``."""
 
-    def test_list_after_add(self, tmp_path: Path) -> None:
+    def test_list_after_add(self, registered_project: Path) -> None:
         """Listing after adding a project returns 1 entry."""
-        project_dir = _make_gsd_project(tmp_path)
+        project_dir = registered_project
 
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            runner.invoke(app, ["projects", "add", str(project_dir)])
-            result = runner.invoke(app, ["projects", "list"])
+        result = runner.invoke(app, ["projects", "list"])
 
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         data = _parse_output(result)
@@ -167,11 +199,7 @@ class TestProjectsList:
 
     def test_list_empty_registry(self, tmp_path: Path) -> None:
         """Listing with no registered projects returns empty list."""
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            result = runner.invoke(app, ["projects", "list"])
+        result = runner.invoke(app, ["projects", "list"])
 
         assert result.exit_code == 0
         data = _parse_output(result)
@@ -185,18 +213,13 @@ class TestProjectsList:
 class TestProjectsRemove:
     """Tests for ``openclawpack projects remove``."""
 
-    def test_remove_existing(self, tmp_path: Path) -> None:
+    def test_remove_existing(self, registered_project: Path) -> None:
         """Removing an existing project returns success."""
-        project_dir = _make_gsd_project(tmp_path)
-
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            runner.invoke(app, ["projects", "add", str(project_dir)])
-            result = runner.invoke(
-                app, ["projects", "remove", project_dir.name]
-            )
+        project_dir = registered_project
+
+        result = runner.invoke(
+            app, ["projects", "remove", project_dir.name]
+        )
 
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         data = _parse_output(result)
@@ -205,32 +228,23 @@ class TestProjectsRemove:
 
     def test_remove_nonexistent(self, tmp_path: Path) -> None:
         """Removing a name that doesn't exist returns an error."""
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            result = runner.invoke(
-                app, ["projects", "remove", "nonexistent"]
-            )
+        result = runner.invoke(
+            app, ["projects", "remove", "nonexistent"]
+        )
 
         assert result.exit_code == 0
         data = _parse_output(result)
         assert data["success"] is False
         assert "not found" in data["errors"][0]
 
-    def test_remove_then_list_empty(self, tmp_path: Path) -> None:
+    def test_remove_then_list_empty(self, registered_project: Path) -> None:
         """After removing the only project, list returns empty."""
-        project_dir = _make_gsd_project(tmp_path)
-
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            runner.invoke(app, ["projects", "add", str(project_dir)])
-            runner.invoke(
-                app, ["projects", "remove", project_dir.name]
-            )
-            result = runner.invoke(app, ["projects", "list"])
+        runner.invoke(
+            app,
+            ["projects", "remove", registered_project.name],
+            catch_exceptions=False,
+        )
+        result = runner.invoke(app, ["projects", "list"])
 
         data = _parse_output(result)
         assert data["success"] is True
@@ -243,18 +257,19 @@ class TestProjectsRemove:
 class TestProjectsQuiet:
     """Tests for --quiet flag on projects commands."""
 
-    def test_add_quiet(self, tmp_path: Path) -> None:
-        """--quiet suppresses output on add."""
-        project_dir = _make_gsd_project(tmp_path)
-
-        with patch(
-            "openclawpack.state.registry._user_data_dir",
-            return_value=tmp_path,
-        ):
-            result = runner.invoke(
-                app,
-                ["projects", "add", str(project_dir), "--quiet"],
-            )
+    def test_add_quiet(self, make_gsd_project: Callable[..., Path]) -> None:
+        """--quiet suppresses output on add but still registers."""
+        from openclawpack.state.registry import ProjectRegistry
+
+        project_dir = make_gsd_project()
+
+        result = runner.invoke(
+            app,
+            ["projects", "add", str(project_dir), "--quiet"],
+        )
 
         assert result.exit_code == 0
         assert result.output.strip() == ""
+        assert [e.name for e in ProjectRegistry.load().list_projects()] == [
+            project_dir.name
+        ]
@@ -1,6 +1,7 @@
 """Tests for the status command workflow."""
 
-import tempfile
+import os
+import shutil
 from pathlib import Path
 from unittest.mock import patch
 
@@ -11,14 +12,7 @@ from openclawpack.commands.status import status_workflow
 
 # ── Fixtures ─────────────────────────────────────────────────────
 
-
-def _create_minimal_planning(tmpdir: str) -> None:
-    """Create a minimal .planning/ directory with required files."""
-    planning = Path(tmpdir) / ".planning"
-    planning.mkdir()
-
-    (planning / "STATE.md").write_text(
-        """\
+_STATE_MD = b"""\
 # Project State
 
 ## Current Position
@@ -26,12 +20,9 @@ def _create_minimal_planning(tmpdir: str) -> None:
 Phase: 1 of 2 (Foundation)
 Plan: 1 of 3 in current phase
 Status: Executing
-""",
-        encoding="utf-8",
-    )
+"""
 
-    (planning / "PROJECT.md").write_text(
-        """\
+_PROJECT_MD = b"""\
 # TestProject
 
 ## What This Is
@@ -41,32 +32,87 @@ A test project for status workflow.
 ## Core Value
 
 Testing status output.
-""",
-        encoding="utf-8",
+"""
+
+
+def _create_minimal_planning(tmpdir: str) -> None:
+    """Create a minimal .planning/ directory with required files."""
+    planning = Path(tmpdir) / ".planning"
+    planning.mkdir()
+    (planning / "STATE.md").write_bytes(_STATE_MD)
+    (planning / "PROJECT.md").write_bytes(_PROJECT_MD)
+
+
+@pytest.fixture(scope="session")
+def _planning_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project root with a minimal .planning/, built once per session."""
+    root = tmp_path_factory.mktemp("planning_template")
+    _create_minimal_planning(str(root))
+    return root
+
+
+@pytest.fixture(scope="session")
+def _full_planning(
+    tmp_path_factory: pytest.TempPathFactory, _planning_template: Path
+) -> Path:
+    """The minimal template plus a REQUIREMENTS.md with traced requirements.
+
+    Read-only: status_workflow never writes, so tests share this directory.
+    """
+    root = tmp_path_factory.mktemp("full_planning")
+    shutil.copytree(
+        _planning_template, root, copy_function=os.link, dirs_exist_ok=True
+    )
+    (root / ".planning" / "REQUIREMENTS.md").write_bytes(
+        b"""\
+# Requirements
+
+## v1 Requirements
+
+- [x] **PKG-01**: Package is pip installable
+- [ ] **CMD-01**: Status command reports progress
+
+## Traceability
+
+| Requirement | Phase | Status |
+|-------------|-------|--------|
+| PKG-01 | Phase 1 | Complete |
+| CMD-01 | Phase 2 | Pending |
+"""
+    )
+    return root
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path, _planning_template: Path) -> str:
+    """tmp_path populated with hardlinks to the minimal .planning/ tree.
+
+    status_workflow only reads, so the links never modify the template.
+    """
+    shutil.copytree(
+        _planning_template, tmp_path, copy_function=os.link, dirs_exist_ok=True
     )
+    return str(tmp_path)
 
 
 # ── Tests ────────────────────────────────────────────────────────
 
 
 class TestStatusWorkflow:
-    def test_status_returns_project_summary(self):
+    def test_status_returns_project_summary(self, project_dir):
         """status_workflow on a valid .planning/ dir returns success."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            _create_minimal_planning(tmpdir)
-            result = status_workflow(project_dir=tmpdir)
-            assert result.success is True
-            assert result.result is not None
-            assert isinstance(result.result, dict)
-            assert "current_phase" in result.result
-
-    def test_status_missing_planning_dir(self):
+        result = status_workflow(project_dir=project_dir)
+        assert result.success is True
+        assert result.result is not None
+        assert isinstance(result.result, dict)
+        assert "current_phase" in result.result
+
+    def test_status_missing_planning_dir(self, tmp_path):
         """status_workflow with no .planning/ returns error result."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = status_workflow(project_dir=tmpdir)
-            assert result.success is False
-            assert len(result.errors) > 0
-            assert "planning" in result.errors[0].lower()
+        result = status_workflow(project_dir=str(tmp_path))
+        assert result.success is False
+        assert len(result.errors) > 0
+        assert "planning" in result.errors[0].lower()
 
     def test_status_default_project_dir(self):
         """status_workflow defaults to cwd when project_dir is None."""
@@ -75,39 +121,35 @@ class TestStatusWorkflow:
             result = status_workflow(project_dir=None)
             assert result.success is False
 
-    def test_status_duration_tracked(self):
+    def test_status_duration_tracked(self, project_dir):
         """duration_ms should be > 0 (or at least >= 0) in the result."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            _create_minimal_planning(tmpdir)
-            result = status_workflow(project_dir=tmpdir)
-            assert result.duration_ms >= 0
+        result = status_workflow(project_dir=project_dir)
+        assert result.duration_ms >= 0
 
-    def test_status_result_has_all_fields(self):
+    def test_status_result_has_all_fields(self, project_dir):
         """The result dict must contain all expected keys."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            _create_minimal_planning(tmpdir)
-            result = status_workflow(project_dir=tmpdir)
-            assert result.success is True
-            expected_keys = {
-                "current_phase",
-                "current_phase_name",
-                "progress_percent",
-                "blockers",
-                "requirements_complete",
-                "requirements_total",
-            }
-            assert expected_keys.issubset(result.result.keys())
-
-    def test_status_error_has_duration(self):
+        result = status_workflow(project_dir=project_dir)
+        assert result.success is True
+        expected_keys = {
+            "current_phase",
+            "current_phase_name",
+            "progress_percent",
+            "blockers",
+            "requirements_complete",
+            "requirements_total",
+        }
+        assert expected_keys.issubset(result.result.keys())
+
+    def test_status_error_has_duration(self, tmp_path):
         """Error results should also track duration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = status_workflow(project_dir=tmpdir)
-            assert result.success is False
-            assert result.duration_ms >= 0
+        result = status_workflow(project_dir=str(tmp_path))
+        assert result.success is False
+        assert result.duration_ms >= 0
 
-    def test_status_on_real_project(self):
-        """status_workflow('.') works on this repo (which has .planning/)."""
-        result = status_workflow(project_dir=".")
+    def test_status_on_full_project(self, _full_planning):
+        """status_workflow reports phase and requirement counts."""
+        result = status_workflow(project_dir=str(_full_planning))
         assert result.success is True
         assert result.result["current_phase"] >= 1
-        assert result.result["requirements_total"] > 0
+        assert result.result["requirements_total"] == 2
+        assert result.result["requirements_complete"] == 1
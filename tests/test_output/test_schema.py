@@ -8,28 +8,20 @@ from openclawpack.output.schema import CommandResult
 class TestCommandResultOk:
     """Tests for successful CommandResult creation."""
 
-    def test_ok_has_success_true(self) -> None:
-        result = CommandResult.ok(result={"phase": 1})
-        assert result.success is True
-
-    def test_ok_has_empty_errors(self) -> None:
-        result = CommandResult.ok(result={"phase": 1})
-        assert result.errors == []
-
-    def test_ok_stores_result(self) -> None:
+    def test_ok_all_fields(self) -> None:
         data = {"phase": 1, "status": "running"}
-        result = CommandResult.ok(result=data)
-        assert result.result == data
-
-    def test_ok_with_session_and_usage(self) -> None:
+        usage = {"input_tokens": 100, "output_tokens": 50}
         result = CommandResult.ok(
-            result="done",
+            result=data,
             session_id="abc-123",
-            usage={"input_tokens": 100, "output_tokens": 50},
+            usage=usage,
             duration_ms=1500,
         )
+        assert result.success is True
+        assert result.errors == []
+        assert result.result == data
         assert result.session_id == "abc-123"
-        assert result.usage == {"input_tokens": 100, "output_tokens": 50}
+        assert result.usage == usage
         assert result.duration_ms == 1500
 
 
@@ -80,21 +72,8 @@ class TestCommandResultSerialization:
             usage={"tokens": 200},
             duration_ms=750,
         )
-        json_str = original.to_json()
-        restored = CommandResult.model_validate_json(json_str)
-
-        assert restored.success == original.success
-        assert restored.result == original.result
-        assert restored.errors == original.errors
-        assert restored.session_id == original.session_id
-        assert restored.usage == original.usage
-        assert restored.duration_ms == original.duration_ms
+        assert CommandResult.model_validate_json(original.to_json()) == original
 
     def test_error_round_trip(self) -> None:
         original = CommandResult.error("bad input", duration_ms=100)
-        json_str = original.to_json()
-        restored = CommandResult.model_validate_json(json_str)
-
-        assert restored.success is False
-        assert restored.errors == ["bad input"]
-        assert restored.duration_ms == 100
+        assert CommandResult.model_validate_json(original.to_json()) == original
@@ -1,5 +1,7 @@
 """Tests for Pydantic models in openclawpack.state.models."""
 
+import pytest
+
 from openclawpack.state.models import (
     PhaseInfo,
     PlanningDirectory,
@@ -78,7 +80,7 @@ class TestProjectState:
             plans_complete=1,
             plans_total=3,
         )
-        assert abs(state.progress_percent - 33.333333) < 0.01
+        assert state.progress_percent == pytest.approx(33.3333, rel=1e-4)
 
     def test_progress_percent_all_plans(self):
         state = ProjectState(
@@ -154,7 +156,7 @@ class TestPlanningDirectory:
             plans_per_phase=3,
             plans_complete_per_phase=1,
         )
-        assert abs(pd.overall_progress - 33.333333) < 0.01
+        assert pd.overall_progress == pytest.approx(33.3333, rel=1e-4)
 
     def test_overall_progress_no_plans(self):
         pd = self._make_directory(
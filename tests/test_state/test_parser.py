@@ -199,6 +199,19 @@ Progress: [##--------] 9%
         assert "Claude Agent SDK is alpha" in state.blockers[0]
         assert len(state.decisions) == 2
 
+    def test_empty_last_activity_does_not_consume_next_line(self):
+        content = """\
+## Current Position
+
+Phase: 1 of 5 (Foundation)
+Last activity:
+Plan: 1 of 3 in current phase
+"""
+        state = parse_state_md(content)
+        assert state.last_activity is None
+        assert state.plans_complete == 1
+        assert state.plans_total == 3
+
     def test_actual_project_state(self):
         """Parse the real STATE.md from this project."""
         state_path = Path(".planning/STATE.md")
@@ -269,6 +282,31 @@ Plans:
         assert roadmap.phases[1].plans_total == 2
         assert roadmap.phases[1].plans_complete == 0
 
+    def test_empty_goal_and_requirements_do_not_consume_next_phase(self):
+        content = """\
+## Phase Details
+
+### Phase 1: Foundation
+**Goal**:
+**Requirements**:
+
+Plans:
+- [x] 01-01-PLAN.md -- Package skeleton
+
+### Phase 2: API
+**Goal**: Serve requests
+
+Plans:
+- [ ] 02-01-PLAN.md -- Endpoints
+"""
+        roadmap = parse_roadmap_md(content)
+        assert [p.number for p in roadmap.phases] == [1, 2]
+        assert roadmap.phases[0].goal is None
+        assert roadmap.phases[0].requirements == []
+        assert roadmap.phases[0].plans_total == 1
+        assert roadmap.phases[1].goal == "Serve requests"
+        assert roadmap.phases[1].plans_total == 1
+
 
 # ---------------------------------------------------------------------------
 # parse_requirements_md tests
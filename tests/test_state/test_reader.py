@@ -6,7 +6,12 @@ from pathlib import Path
 
 import pytest
 
-from openclawpack.state.reader import get_project_summary, read_project_state
+from openclawpack.state import reader
+from openclawpack.state.reader import (
+    clear_state_cache,
+    get_project_summary,
+    read_project_state,
+)
 
 
 class TestReadProjectState:
@@ -149,3 +154,49 @@ class TestGetProjectSummary:
         summary = get_project_summary(".")
         assert summary["requirements_complete"] <= summary["requirements_total"]
         assert summary["requirements_total"] > 0
+
+
+class TestReadProjectStateCache:
+    """read_project_state reuses parsed state until a planning file changes."""
+
+    def _make_planning(self, tmp_path: Path) -> Path:
+        planning = tmp_path / ".planning"
+        planning.mkdir()
+        (planning / "STATE.md").write_text(
+            "# Project State\n\n## Current Position\n\nPhase: 1 of 2 (First)\n"
+        )
+        (planning / "PROJECT.md").write_text("# Cached\n\n## What This Is\n\nX.\n")
+        return planning
+
+    def test_repeat_reads_return_equal_copies(self, tmp_path):
+        self._make_planning(tmp_path)
+        first = read_project_state(tmp_path)
+        first.state.blockers.append("mutated")
+        second = read_project_state(tmp_path)
+        assert second is not first
+        assert second.state.blockers == []
+
+    def test_edit_invalidates_cache(self, tmp_path):
+        planning = self._make_planning(tmp_path)
+        assert read_project_state(tmp_path).state.current_phase == 1
+        (planning / "STATE.md").write_text(
+            "# Project State\n\n## Current Position\n\nPhase: 2 of 2 (Second)\n"
+        )
+        pd = read_project_state(tmp_path)
+        assert pd.state.current_phase == 2
+        assert pd.state.current_phase_name == "Second"
+
+    def test_cache_is_bounded(self, tmp_path):
+        clear_state_cache()
+        for i in range(reader._STATE_CACHE_SIZE + 3):
+            project = tmp_path / f"p{i}"
+            project.mkdir()
+            self._make_planning(project)
+            read_project_state(project)
+        assert len(reader._STATE_CACHE) == reader._STATE_CACHE_SIZE
+
+    def test_clear_state_cache(self, tmp_path):
+        self._make_planning(tmp_path)
+        read_project_state(tmp_path)
+        clear_state_cache()
+        assert not reader._STATE_CACHE
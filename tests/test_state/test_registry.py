@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from pathlib import Path
 from unittest.mock import patch
@@ -12,6 +13,13 @@ import pytest
 from openclawpack.state.models import ProjectRegistryData, RegistryEntry
 
 
+def _make_gsd_project(base_path: Path, name: str = "myproject") -> Path:
+    """Create a minimal GSD project directory structure."""
+    project_dir = base_path / name
+    (project_dir / ".planning").mkdir(parents=True)
+    return project_dir
+
+
 # ---------------------------------------------------------------------------
 # RegistryEntry model
 # ---------------------------------------------------------------------------
@@ -145,6 +153,17 @@ class TestUserDataDir:
             result = _user_data_dir()
             assert "openclawpack" in str(result)
 
+    def test_cached_until_environment_changes(self):
+        from openclawpack.state.registry import _user_data_dir
+
+        with patch.object(sys, "platform", "linux"), patch.dict(
+            "os.environ", {"XDG_DATA_HOME": "/one"}, clear=True
+        ):
+            first = _user_data_dir()
+            assert _user_data_dir() is first
+            os.environ["XDG_DATA_HOME"] = "/two"
+            assert str(_user_data_dir()) == "/two/openclawpack"
+
 
 # ---------------------------------------------------------------------------
 # ProjectRegistry.load
@@ -206,8 +225,7 @@ class TestProjectRegistrySave:
         registry = ProjectRegistry.load(registry_file)
         registry.save()
 
-        content = registry_file.read_text(encoding="utf-8")
-        data = json.loads(content)
+        data = json.loads(registry_file.read_text(encoding="utf-8"))
         assert data["version"] == 1
         assert data["projects"] == {}
 
@@ -238,8 +256,7 @@ class TestProjectRegistrySave:
         registry._data.projects["testproj"] = entry
         registry.save()
 
-        content = registry_file.read_text(encoding="utf-8")
-        data = json.loads(content)
+        data = json.loads(registry_file.read_text(encoding="utf-8"))
         assert "testproj" in data["projects"]
         assert data["projects"]["testproj"]["path"] == "/tmp/testproj"
 
@@ -252,18 +269,11 @@ class TestProjectRegistrySave:
 class TestProjectRegistryAdd:
     """Adding projects to registry."""
 
-    def _make_gsd_project(self, base_path: Path, name: str = "myproject") -> Path:
-        """Create a minimal GSD project directory structure."""
-        project_dir = base_path / name
-        project_dir.mkdir(parents=True, exist_ok=True)
-        (project_dir / ".planning").mkdir(exist_ok=True)
-        return project_dir
-
     def test_add_valid_project(self, tmp_path: Path):
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        project_dir = self._make_gsd_project(tmp_path)
+        project_dir = _make_gsd_project(tmp_path)
 
         registry = ProjectRegistry.load(registry_file)
         with patch(
@@ -284,7 +294,7 @@ class TestProjectRegistryAdd:
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        project_dir = self._make_gsd_project(tmp_path)
+        project_dir = _make_gsd_project(tmp_path)
 
         registry = ProjectRegistry.load(registry_file)
         with patch(
@@ -302,7 +312,7 @@ class TestProjectRegistryAdd:
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        project_dir = self._make_gsd_project(tmp_path)
+        project_dir = _make_gsd_project(tmp_path)
 
         registry = ProjectRegistry.load(registry_file)
         with patch(
@@ -338,8 +348,8 @@ class TestProjectRegistryAdd:
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        project_dir1 = self._make_gsd_project(tmp_path, "proj1")
-        project_dir2 = self._make_gsd_project(tmp_path, "proj2")
+        project_dir1 = _make_gsd_project(tmp_path, "proj1")
+        project_dir2 = _make_gsd_project(tmp_path, "proj2")
 
         registry = ProjectRegistry.load(registry_file)
         with patch(
@@ -354,7 +364,7 @@ class TestProjectRegistryAdd:
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        project_dir = self._make_gsd_project(tmp_path)
+        project_dir = _make_gsd_project(tmp_path)
 
         registry = ProjectRegistry.load(registry_file)
         with patch(
@@ -369,7 +379,7 @@ class TestProjectRegistryAdd:
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        project_dir = self._make_gsd_project(tmp_path)
+        project_dir = _make_gsd_project(tmp_path)
 
         registry = ProjectRegistry.load(registry_file)
         with patch(
@@ -391,17 +401,11 @@ class TestProjectRegistryAdd:
 class TestProjectRegistryRemove:
     """Removing projects from registry."""
 
-    def _make_gsd_project(self, base_path: Path, name: str = "myproject") -> Path:
-        project_dir = base_path / name
-        project_dir.mkdir(parents=True, exist_ok=True)
-        (project_dir / ".planning").mkdir(exist_ok=True)
-        return project_dir
-
     def test_remove_existing_returns_true(self, tmp_path: Path):
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        project_dir = self._make_gsd_project(tmp_path)
+        project_dir = _make_gsd_project(tmp_path)
 
         registry = ProjectRegistry.load(registry_file)
         with patch(
@@ -418,7 +422,7 @@ class TestProjectRegistryRemove:
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        project_dir = self._make_gsd_project(tmp_path)
+        project_dir = _make_gsd_project(tmp_path)
 
         registry = ProjectRegistry.load(registry_file)
         with patch(
@@ -451,12 +455,6 @@ class TestProjectRegistryRemove:
 class TestProjectRegistryListProjects:
     """Listing projects from registry."""
 
-    def _make_gsd_project(self, base_path: Path, name: str = "myproject") -> Path:
-        project_dir = base_path / name
-        project_dir.mkdir(parents=True, exist_ok=True)
-        (project_dir / ".planning").mkdir(exist_ok=True)
-        return project_dir
-
     def test_empty_registry_returns_empty_list(self, tmp_path: Path):
         from openclawpack.state.registry import ProjectRegistry
 
@@ -469,8 +467,8 @@ class TestProjectRegistryListProjects:
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        proj1 = self._make_gsd_project(tmp_path, "proj1")
-        proj2 = self._make_gsd_project(tmp_path, "proj2")
+        proj1 = _make_gsd_project(tmp_path, "proj1")
+        proj2 = _make_gsd_project(tmp_path, "proj2")
 
         registry = ProjectRegistry.load(registry_file)
         with patch(
@@ -489,7 +487,7 @@ class TestProjectRegistryListProjects:
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        proj1 = self._make_gsd_project(tmp_path, "proj1")
+        proj1 = _make_gsd_project(tmp_path, "proj1")
 
         registry = ProjectRegistry.load(registry_file)
         with patch(
@@ -501,6 +499,27 @@ class TestProjectRegistryListProjects:
         entries = registry.list_projects()
         assert all(isinstance(e, RegistryEntry) for e in entries)
 
+    def test_iter_projects_matches_list(self, tmp_path: Path):
+        from openclawpack.state.registry import ProjectRegistry
+
+        registry_file = tmp_path / "registry.json"
+        proj1 = _make_gsd_project(tmp_path, "proj1")
+        proj2 = _make_gsd_project(tmp_path, "proj2")
+
+        registry = ProjectRegistry.load(registry_file)
+        with patch(
+            "openclawpack.state.registry.get_project_summary",
+            return_value={"current_phase": 1},
+        ):
+            registry.add(proj1)
+            registry.add(proj2)
+
+        it = registry.iter_projects()
+        assert next(it).name == "proj1"
+        assert [e.name for e in registry.iter_projects()] == [
+            e.name for e in registry.list_projects()
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Persistence round-trip
@@ -510,17 +529,11 @@ class TestProjectRegistryListProjects:
 class TestPersistenceRoundTrip:
     """Full persistence: add, load from disk, verify."""
 
-    def _make_gsd_project(self, base_path: Path, name: str = "myproject") -> Path:
-        project_dir = base_path / name
-        project_dir.mkdir(parents=True, exist_ok=True)
-        (project_dir / ".planning").mkdir(exist_ok=True)
-        return project_dir
-
     def test_add_then_reload(self, tmp_path: Path):
         from openclawpack.state.registry import ProjectRegistry
 
         registry_file = tmp_path / "registry.json"
-        project_dir = self._make_gsd_project(tmp_path)
+        project_dir = _make_gsd_project(tmp_path)
 
         # First registry: add project
         registry1 = ProjectRegistry.load(registry_file)
@@ -9,6 +9,8 @@ Verifies:
 
 from __future__ import annotations
 
+import itertools
+
 import pytest
 
 from openclawpack.transport.errors import (
@@ -20,23 +22,26 @@ from openclawpack.transport.errors import (
     TransportTimeout,
 )
 
+# Every concrete TransportError subclass; none may catch another.
+_SIBLINGS = [
+    CLINotFound,
+    ProcessError,
+    TransportTimeout,
+    JSONDecodeError,
+    ConnectionError_,
+]
+
 
 # ── Inheritance tests ─────────────────────────────────────────────
 
 class TestInheritance:
     """All transport exceptions must inherit from TransportError."""
 
-    @pytest.mark.parametrize(
-        "exc_cls",
-        [CLINotFound, ProcessError, TransportTimeout, JSONDecodeError, ConnectionError_],
-    )
+    @pytest.mark.parametrize("exc_cls", _SIBLINGS)
     def test_is_subclass_of_transport_error(self, exc_cls: type) -> None:
         assert issubclass(exc_cls, TransportError)
 
-    @pytest.mark.parametrize(
-        "exc_cls",
-        [CLINotFound, ProcessError, TransportTimeout, JSONDecodeError, ConnectionError_],
-    )
+    @pytest.mark.parametrize("exc_cls", _SIBLINGS)
     def test_is_subclass_of_exception(self, exc_cls: type) -> None:
         assert issubclass(exc_cls, Exception)
 
@@ -46,40 +51,19 @@ class TestInheritance:
 class TestIndependentCatch:
     """Each exception type must be catchable independently."""
 
-    def test_cli_not_found_not_caught_by_process_error(self) -> None:
-        with pytest.raises(CLINotFound):
-            try:
-                raise CLINotFound()
-            except ProcessError:
-                pytest.fail("CLINotFound should not be caught by ProcessError")
-
-    def test_process_error_not_caught_by_cli_not_found(self) -> None:
-        with pytest.raises(ProcessError):
-            try:
-                raise ProcessError()
-            except CLINotFound:
-                pytest.fail("ProcessError should not be caught by CLINotFound")
-
-    def test_timeout_not_caught_by_json_decode(self) -> None:
-        with pytest.raises(TransportTimeout):
-            try:
-                raise TransportTimeout()
-            except JSONDecodeError:
-                pytest.fail("TransportTimeout should not be caught by JSONDecodeError")
-
-    def test_json_decode_not_caught_by_timeout(self) -> None:
-        with pytest.raises(JSONDecodeError):
-            try:
-                raise JSONDecodeError()
-            except TransportTimeout:
-                pytest.fail("JSONDecodeError should not be caught by TransportTimeout")
-
-    def test_connection_error_not_caught_by_process_error(self) -> None:
-        with pytest.raises(ConnectionError_):
+    @pytest.mark.parametrize(
+        "raised, unrelated",
+        list(itertools.permutations(_SIBLINGS, 2)),
+        ids=lambda cls: cls.__name__,
+    )
+    def test_not_caught_by_sibling(self, raised: type, unrelated: type) -> None:
+        with pytest.raises(raised):
             try:
-                raise ConnectionError_()
-            except ProcessError:
-                pytest.fail("ConnectionError_ should not be caught by ProcessError")
+                raise raised()
+            except unrelated:
+                pytest.fail(
+                    f"{raised.__name__} should not be caught by {unrelated.__name__}"
+                )
 
 
 # ── Catch-all tests ──────────────────────────────────────────────
@@ -87,10 +71,7 @@ class TestIndependentCatch:
 class TestCatchAll:
     """TransportError catches all transport exceptions."""
 
-    @pytest.mark.parametrize(
-        "exc_cls",
-        [CLINotFound, ProcessError, TransportTimeout, JSONDecodeError, ConnectionError_],
-    )
+    @pytest.mark.parametrize("exc_cls", _SIBLINGS)
     def test_transport_error_catches_all(self, exc_cls: type) -> None:
         with pytest.raises(TransportError):
             raise exc_cls()
@@ -101,62 +82,68 @@ class TestCatchAll:
 class TestStringRepresentation:
     """Exception __str__ includes stored context fields."""
 
-    def test_transport_error_default_message(self) -> None:
-        e = TransportError()
-        assert "Transport operation failed" in str(e)
-
-    def test_transport_error_custom_message(self) -> None:
-        e = TransportError("something broke")
-        assert "something broke" in str(e)
-
-    def test_cli_not_found_includes_install_suggestion(self) -> None:
-        e = CLINotFound()
-        s = str(e)
-        assert "Claude Code CLI not found" in s
-        assert "npm install" in s
-
-    def test_process_error_includes_exit_code(self) -> None:
-        e = ProcessError("failed", exit_code=42)
-        s = str(e)
-        assert "exit_code=42" in s
-
-    def test_process_error_includes_stderr(self) -> None:
-        e = ProcessError("failed", stderr="bad stuff")
-        s = str(e)
-        assert "bad stuff" in s
-
-    def test_process_error_default_no_extra_context(self) -> None:
-        e = ProcessError()
-        s = str(e)
-        assert "exit_code" not in s
-        assert "stderr" not in s
-
-    def test_timeout_includes_seconds(self) -> None:
-        e = TransportTimeout("timed out", timeout_seconds=60.0)
-        s = str(e)
-        assert "timeout_seconds=60.0" in s
-
-    def test_timeout_default_no_seconds(self) -> None:
-        e = TransportTimeout()
-        s = str(e)
-        assert "timeout_seconds" not in s
-
-    def test_json_decode_includes_raw_output(self) -> None:
-        e = JSONDecodeError("bad json", raw_output='{"broken')
-        s = str(e)
-        assert '{"broken' in s
+    @pytest.mark.parametrize(
+        "exc, present, absent",
+        [
+            pytest.param(
+                TransportError(), ["Transport operation failed"], [],
+                id="transport_error_default_message",
+            ),
+            pytest.param(
+                TransportError("something broke"), ["something broke"], [],
+                id="transport_error_custom_message",
+            ),
+            pytest.param(
+                CLINotFound(), ["Claude Code CLI not found", "npm install"], [],
+                id="cli_not_found_install_suggestion",
+            ),
+            pytest.param(
+                ProcessError("failed", exit_code=42), ["exit_code=42"], [],
+                id="process_error_exit_code",
+            ),
+            pytest.param(
+                ProcessError("failed", stderr="bad stuff"), ["bad stuff"], [],
+                id="process_error_stderr",
+            ),
+            pytest.param(
+                ProcessError(), [], ["exit_code", "stderr"],
+                id="process_error_default_no_extra_context",
+            ),
+            pytest.param(
+                TransportTimeout("timed out", timeout_seconds=60.0),
+                ["timeout_seconds=60.0"], [],
+                id="timeout_seconds",
+            ),
+            pytest.param(
+                TransportTimeout(), [], ["timeout_seconds"],
+                id="timeout_default_no_seconds",
+            ),
+            pytest.param(
+                JSONDecodeError("bad json", raw_output='{"broken'), ['{"broken'], [],
+                id="json_decode_raw_output",
+            ),
+            pytest.param(
+                ConnectionError_(), ["Connection to Claude Code subprocess lost"], [],
+                id="connection_error_message",
+            ),
+        ],
+    )
+    def test_str(
+        self, exc: TransportError, present: list[str], absent: list[str]
+    ) -> None:
+        s = str(exc)
+        for text in present:
+            assert text in s
+        for text in absent:
+            assert text not in s
 
     def test_json_decode_truncates_long_output(self) -> None:
-        long_output = "x" * 500
-        e = JSONDecodeError("bad json", raw_output=long_output)
+        # Input far past the 200-char cut: output must stay bounded
+        e = JSONDecodeError("bad json", raw_output="x" * 10_000)
         s = str(e)
         assert "..." in s
-        # The repr of a 200-char string + "..." should be shorter than 500 chars
-        assert len(s) < 500
-
-    def test_connection_error_message(self) -> None:
-        e = ConnectionError_()
-        assert "Connection to Claude Code subprocess lost" in str(e)
+        assert len(s) < 300, f"truncation broken: str is {len(s)} chars"
+        assert s.count("x") <= 200
 
 
 # ── Context field storage tests ───────────────────────────────────
@@ -164,35 +151,44 @@ class TestStringRepresentation:
 class TestContextFields:
     """Exceptions store their context fields as attributes."""
 
-    def test_process_error_stores_exit_code(self) -> None:
-        e = ProcessError("fail", exit_code=1)
-        assert e.exit_code == 1
-
-    def test_process_error_stores_stderr(self) -> None:
-        e = ProcessError("fail", stderr="error output")
-        assert e.stderr == "error output"
-
-    def test_process_error_defaults(self) -> None:
-        e = ProcessError()
-        assert e.exit_code is None
-        assert e.stderr is None
-
-    def test_timeout_stores_seconds(self) -> None:
-        e = TransportTimeout("timeout", timeout_seconds=30.5)
-        assert e.timeout_seconds == 30.5
-
-    def test_json_decode_stores_raw_output(self) -> None:
-        e = JSONDecodeError("decode fail", raw_output="raw")
-        assert e.raw_output == "raw"
-
-    def test_json_decode_default_raw_output(self) -> None:
-        e = JSONDecodeError()
-        assert e.raw_output is None
-
-    def test_all_exceptions_store_message(self) -> None:
-        e = TransportError("msg1")
-        assert e.message == "msg1"
-        e2 = CLINotFound("msg2")
-        assert e2.message == "msg2"
-        e3 = ProcessError("msg3")
-        assert e3.message == "msg3"
+    @pytest.mark.parametrize(
+        "exc, attrs",
+        [
+            pytest.param(
+                ProcessError("fail", exit_code=1, stderr="error output"),
+                {"exit_code": 1, "stderr": "error output"},
+                id="process_error_exit_code_and_stderr",
+            ),
+            pytest.param(
+                ProcessError(), {"exit_code": None, "stderr": None},
+                id="process_error_defaults",
+            ),
+            pytest.param(
+                TransportTimeout("timeout", timeout_seconds=30.5),
+                {"timeout_seconds": 30.5},
+                id="timeout_seconds",
+            ),
+            pytest.param(
+                JSONDecodeError("decode fail", raw_output="raw"),
+                {"raw_output": "raw"},
+                id="json_decode_raw_output",
+            ),
+            pytest.param(
+                JSONDecodeError(), {"raw_output": None},
+                id="json_decode_default_raw_output",
+            ),
+            pytest.param(
+                TransportError("msg1"), {"message": "msg1"},
+                id="transport_error_message",
+            ),
+            pytest.param(
+                CLINotFound("msg2"), {"message": "msg2"}, id="cli_not_found_message"
+            ),
+            pytest.param(
+                ProcessError("msg3"), {"message": "msg3"}, id="process_error_message"
+            ),
+        ],
+    )
+    def test_stores_context(self, exc: TransportError, attrs: dict) -> None:
+        for name, expected in attrs.items():
+            assert getattr(exc, name) == expected